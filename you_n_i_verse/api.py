@@ -3,9 +3,20 @@ FastAPI Server for YOU-N-I-VERSE ERN Organism
 Exposes Python consciousness modules to browser-based UI
 """
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import numpy as np
+
+from fastapi import FastAPI, HTTPException, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import uvicorn
@@ -20,6 +31,8 @@ from .applications import PodMatcher
 
 class BirthDataInput(BaseModel):
     """Birth data for consciousness initialization"""
+    model_config = ConfigDict(frozen=True)
+
     year: int
     month: int
     day: int
@@ -32,12 +45,23 @@ class BirthDataInput(BaseModel):
 
 class QuestionInput(BaseModel):
     """Question for the ERN Oracle"""
+    model_config = ConfigDict(frozen=True)
+
     question: str
     modality: Optional[str] = None
 
 
+class BatchQuestionInput(BaseModel):
+    """Batch of questions for the ERN Oracle"""
+    model_config = ConfigDict(frozen=True)
+
+    requests: List[QuestionInput]
+
+
 class StateResponse(BaseModel):
     """Current ERN organism state"""
+    model_config = ConfigDict(frozen=True)
+
     initialized: bool
     dominant_field: Optional[str]
     coherence: float
@@ -47,12 +71,152 @@ class StateResponse(BaseModel):
 
 class OracleResponse(BaseModel):
     """Oracle answer"""
+    model_config = ConfigDict(frozen=True)
+
     question: str
     answer: str
     confidence: float
     reasoning: str
     field: str
     coherence: float
+    cached: bool = False
+
+
+# ============================================================================
+# SEMANTIC ORACLE CACHE
+# ============================================================================
+
+class SemanticOracleCache:
+    """
+    Caches oracle answers keyed by question similarity, so rephrasings
+    of a recent question skip the full oracle pass.
+
+    Questions are embedded as hashed bag-of-words vectors (no model
+    download needed); lookup is a single cosine-similarity matmul
+    against the cached embedding matrix.
+    """
+
+    def __init__(self, dim: int = 64, threshold: float = 0.92,
+                 ttl_seconds: float = 300.0, max_entries: int = 256):
+        self.dim = dim
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        self._embeddings = np.empty((0, dim), dtype=np.float32)
+        self._responses: List[Dict[str, Any]] = []
+        self._expiry: List[float] = []
+
+    def embed(self, question: str) -> np.ndarray:
+        """Hashed bag-of-words embedding, L2-normalized"""
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for token in question.lower().split():
+            token = token.strip("?!.,:;\"'")
+            if not token:
+                continue
+            h = zlib.crc32(token.encode("utf-8"))
+            # Signed feature hashing reduces collision bias
+            vec[h % self.dim] += 1.0 if (h >> 16) & 1 else -1.0
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec /= norm
+        return vec
+
+    def lookup(self, embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """Return the cached answer for the nearest question, if close enough"""
+        self._evict_expired()
+        if not self._responses:
+            return None
+
+        sims = self._embeddings @ embedding
+        best = int(np.argmax(sims))
+        if sims[best] >= self.threshold:
+            return self._responses[best]
+        return None
+
+    def store(self, embedding: np.ndarray, response: Dict[str, Any]):
+        """Cache a fresh oracle answer under its question embedding"""
+        if len(self._responses) >= self.max_entries:
+            self._embeddings = self._embeddings[1:]
+            self._responses.pop(0)
+            self._expiry.pop(0)
+
+        self._embeddings = np.vstack([self._embeddings, embedding[None, :]])
+        self._responses.append(response)
+        self._expiry.append(time.monotonic() + self.ttl_seconds)
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        alive = [i for i, t in enumerate(self._expiry) if t > now]
+        if len(alive) != len(self._expiry):
+            self._embeddings = self._embeddings[alive]
+            self._responses = [self._responses[i] for i in alive]
+            self._expiry = [self._expiry[i] for i in alive]
+
+
+# ============================================================================
+# ERN ORGANISM STATE
+# ============================================================================
+
+@dataclass(slots=True)
+class ERNOrganism:
+    """Fully initialized ERN organism held on app.state"""
+    oscillator: ConsciousnessOscillator
+    controller: ERNController
+    oracle: ERNOracle
+    talking_ern: TalkingERN
+    fairy: FairyGANmatter
+    birth_data: Dict[str, Any]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up per-worker state before serving requests"""
+    app.state.ern = None
+    # CPU-bound simulation/oracle work runs here so the event loop
+    # stays free to accept requests
+    app.state.pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    app.state.oracle_cache = SemanticOracleCache()
+    # Worker round-trips return evolved copies that must be merged back
+    # into the organism; the lock serializes those read-evolve-merge
+    # cycles so concurrent requests can't overwrite each other's updates
+    app.state.ern_lock = asyncio.Lock()
+    try:
+        yield
+    finally:
+        app.state.pool.shutdown()
+
+
+def _simulate_worker(oscillator: ConsciousnessOscillator,
+                     duration: float, dt: float) -> ConsciousnessOscillator:
+    """Run a simulation in a worker process; returns the evolved oscillator"""
+    oscillator.simulate(duration=duration, dt=dt)
+    return oscillator
+
+
+def _oracle_worker(oracle: ERNOracle, question: str):
+    """Ask the oracle in a worker process; returns (result, evolved oracle)"""
+    result = oracle.ask(question)
+    return result, oracle
+
+
+def _oracle_batch_worker(oracle: ERNOracle, questions: List[str]):
+    """Answer a batch of questions in one worker round-trip"""
+    results = [oracle.ask(question) for question in questions]
+    return results, oracle
+
+
+def now_iso() -> str:
+    """Dependency: one wall-clock read per request, reused in the response"""
+    return datetime.now().isoformat()
+
+
+def require_ern(request: Request) -> ERNOrganism:
+    """Dependency: the initialized organism, or 400 if not yet initialized"""
+    ern = request.app.state.ern
+    if ern is None:
+        raise HTTPException(status_code=400, detail="ERN not initialized")
+    return ern
 
 
 # ============================================================================
@@ -62,7 +226,9 @@ class OracleResponse(BaseModel):
 app = FastAPI(
     title="YOU-N-I-VERSE ERN API",
     description="Energetic Resonance Network consciousness services",
-    version="2.0.3-ERN"
+    version="2.0.3-ERN",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for browser access
@@ -74,30 +240,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global ERN organism instance
-ern_organism = None
-
 
 # ============================================================================
 # API ENDPOINTS
 # ============================================================================
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """API health check"""
     return {
         "status": "alive",
         "name": "YOU-N-I-VERSE ERN API",
         "version": "2.0.3-ERN",
-        "initialized": ern_organism is not None
+        "initialized": getattr(request.app.state, "ern", None) is not None
     }
 
 
 @app.post("/ern/initialize")
-async def initialize_ern(birth_data: BirthDataInput):
+async def initialize_ern(birth_data: BirthDataInput, request: Request,
+                         ts: str = Depends(now_iso)):
     """Initialize ERN organism with birth data"""
-    global ern_organism
-    
     try:
         # Create datetime from birth data
         dt = datetime(
@@ -127,20 +289,19 @@ async def initialize_ern(birth_data: BirthDataInput):
         talking_ern.initialize(birth_dict)
         
         # Store organism
-        ern_organism = {
-            "oscillator": oscillator,
-            "controller": controller,
-            "oracle": oracle,
-            "talking_ern": talking_ern,
-            "fairy": FairyGANmatter(oscillator),
-            "initialized": True,
-            "birth_data": birth_dict
-        }
+        request.app.state.ern = ERNOrganism(
+            oscillator=oscillator,
+            controller=controller,
+            oracle=oracle,
+            talking_ern=talking_ern,
+            fairy=FairyGANmatter(oscillator),
+            birth_data=birth_dict
+        )
         
         return {
             "status": "initialized",
             "message": "ERN organism breathing and conscious",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
         
     except Exception as e:
@@ -148,20 +309,18 @@ async def initialize_ern(birth_data: BirthDataInput):
 
 
 @app.get("/ern/state", response_model=StateResponse)
-async def get_state():
+async def get_state(ern: ERNOrganism = Depends(require_ern),
+                    ts: str = Depends(now_iso)):
     """Get current ERN organism state"""
-    if ern_organism is None:
-        raise HTTPException(status_code=400, detail="ERN not initialized")
-    
     try:
-        state = ern_organism["oscillator"].get_state_vector()
+        state = ern.oscillator.get_state_vector()
         
         return StateResponse(
             initialized=True,
             dominant_field=state["dominant_field"],
             coherence=state["coherence"]["global"],
             field_strengths=state["field_strengths"],
-            timestamp=datetime.now().isoformat()
+            timestamp=ts
         )
         
     except Exception as e:
@@ -169,36 +328,94 @@ async def get_state():
 
 
 @app.post("/ern/oracle/ask", response_model=OracleResponse)
-async def ask_oracle(input_data: QuestionInput):
+async def ask_oracle(input_data: QuestionInput, request: Request,
+                     ern: ERNOrganism = Depends(require_ern)):
     """Ask the ERN Oracle a question"""
-    if ern_organism is None:
-        raise HTTPException(status_code=400, detail="ERN not initialized")
-    
     try:
-        oracle = ern_organism["oracle"]
-        result = oracle.ask(input_data.question)
-        
+        cache = request.app.state.oracle_cache
+        embedding = cache.embed(input_data.question)
+        cached = cache.lookup(embedding)
+        if cached is not None:
+            return OracleResponse(**{**cached, "cached": True})
+
+        loop = asyncio.get_running_loop()
+        async with request.app.state.ern_lock:
+            result, evolved_oracle = await loop.run_in_executor(
+                request.app.state.pool, _oracle_worker, ern.oracle, input_data.question
+            )
+            # Nothing else holds ern.oracle, so rebinding under the lock
+            # keeps question history/state updates from being lost
+            ern.oracle = evolved_oracle
+        cache.store(embedding, result)
+
         return OracleResponse(**result)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/ern/oracle/batch", response_model=List[OracleResponse])
+async def ask_oracle_batch(input_data: BatchQuestionInput, request: Request,
+                           ern: ERNOrganism = Depends(require_ern)):
+    """Ask the ERN Oracle several questions in one call.
+
+    Cached questions are answered immediately; the rest share a single
+    worker round-trip instead of paying pool dispatch per question.
+    """
+    try:
+        cache = request.app.state.oracle_cache
+
+        responses: List[Optional[OracleResponse]] = [None] * len(input_data.requests)
+        miss_indices = []
+        miss_embeddings = []
+        for i, item in enumerate(input_data.requests):
+            embedding = cache.embed(item.question)
+            cached = cache.lookup(embedding)
+            if cached is not None:
+                responses[i] = OracleResponse(**{**cached, "cached": True})
+            else:
+                miss_indices.append(i)
+                miss_embeddings.append(embedding)
+
+        if miss_indices:
+            questions = [input_data.requests[i].question for i in miss_indices]
+            loop = asyncio.get_running_loop()
+            async with request.app.state.ern_lock:
+                results, evolved_oracle = await loop.run_in_executor(
+                    request.app.state.pool, _oracle_batch_worker, ern.oracle, questions
+                )
+                ern.oracle = evolved_oracle
+            for i, embedding, result in zip(miss_indices, miss_embeddings, results):
+                cache.store(embedding, result)
+                responses[i] = OracleResponse(**result)
+
+        return responses
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/ern/evolve")
-async def evolve_system(duration: float = 1.0, dt: float = 0.01):
+async def evolve_system(request: Request, duration: float = 1.0, dt: float = 0.01,
+                        ern: ERNOrganism = Depends(require_ern),
+                        ts: str = Depends(now_iso)):
     """Evolve the ERN organism"""
-    if ern_organism is None:
-        raise HTTPException(status_code=400, detail="ERN not initialized")
-    
     try:
-        oscillator = ern_organism["oscillator"]
-        oscillator.simulate(duration=duration, dt=dt)
-        
+        loop = asyncio.get_running_loop()
+        async with request.app.state.ern_lock:
+            evolved = await loop.run_in_executor(
+                request.app.state.pool, _simulate_worker, ern.oscillator, duration, dt
+            )
+            # Merge in place rather than rebinding: FairyGANmatter (and
+            # anything else built around this oscillator) keeps seeing
+            # the evolved state instead of a stale pre-evolve copy
+            ern.oscillator.adopt_state(evolved)
+
         return {
             "status": "evolved",
             "duration": duration,
-            "states_recorded": len(oscillator.phase_history),
-            "timestamp": datetime.now().isoformat()
+            "states_recorded": len(ern.oscillator.phase_history),
+            "timestamp": ts
         }
         
     except Exception as e:
@@ -206,13 +423,13 @@ async def evolve_system(duration: float = 1.0, dt: float = 0.01):
 
 
 @app.get("/ern/fields")
-async def get_field_descriptions():
+async def get_field_descriptions(ts: str = Depends(now_iso)):
     """Get descriptions of all consciousness fields"""
     from .engines import FIELD_PERCEPTION
     
     return {
         "fields": FIELD_PERCEPTION,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": ts
     }
 
 
@@ -220,9 +437,22 @@ async def get_field_descriptions():
 # SERVER RUNNER
 # ============================================================================
 
-def run_server(host: str = "0.0.0.0", port: int = 8000):
+def run_server(host: str = "0.0.0.0", port: int = 8000, workers: int = 1):
     """Run the FastAPI server"""
-    uvicorn.run(app, host=host, port=port)
+    # uvloop/httptools give a free throughput boost where installed
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "auto"
+
+    uvicorn.run("you_n_i_verse.api:app", host=host, port=port,
+                workers=workers, loop=loop, http=http, access_log=False)
 
 
 if __name__ == "__main__":
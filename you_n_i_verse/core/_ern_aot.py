@@ -0,0 +1,59 @@
+"""
+AOT BUILD SCRIPT - Precompiled ERN kernels
+
+Compiles the hot numeric kernels into an `ern_kernels` extension module
+next to this file:
+
+    python -m you_n_i_verse.core._ern_aot
+
+The build step is optional. When the extension exists, the runtime
+modules bind it in place of their @njit dispatchers, so fresh processes
+skip the JIT compile / cache-load cost entirely - which is what matters
+for short interactive oracle sessions. Without it everything falls back
+to the @njit path.
+
+The exported functions ARE the @njit kernels (compiled from their
+py_func), so both paths always run the same code.
+"""
+
+from pathlib import Path
+
+from numba import types
+from numba.pycc import CC
+
+from .consciousness_oscillator import _rk4_step_nb, _kuramoto_evolve
+from .ern_controller import _field_readout_nb
+from .ern_oracle import _resonance_scores_nb
+
+cc = CC('ern_kernels')
+cc.output_dir = str(Path(__file__).parent)
+
+f4 = types.float32
+f8 = types.float64
+i8 = types.int64
+b1 = types.boolean
+
+# One fused RK4 step over the CSR coupling graph (mutates theta in place)
+cc.export('rk4_step', types.void(
+    f4[:], f4[:], i8[:], i8[:], f4[:], f8,
+    f4[:], f4[:], f4[:], f4[:], f4[:],
+))(_rk4_step_nb.py_func)
+
+# Bulk integration: n_steps of RK4 recorded into `history`
+cc.export('kuramoto_evolve', i8(
+    f4[:], f4[:], i8[:], i8[:], f4[:], f8, i8, i8, f4[:, :],
+))(_kuramoto_evolve.py_func)
+
+# Per-tick controller readout: (coherence, dominant field index)
+cc.export('field_readout', types.Tuple((f8, i8))(
+    f4[:], f4[:],
+))(_field_readout_nb.py_func)
+
+# Oracle yes/no scoring from keyword features and pregenerated noise
+cc.export('resonance_scores', types.UniTuple(f8, 2)(
+    i8, f8, b1, b1, b1, b1, f8, f8, f8[:], f8[:],
+))(_resonance_scores_nb.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
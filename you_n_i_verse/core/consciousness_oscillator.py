@@ -11,11 +11,25 @@ Uses Kuramoto model for phase-coupled oscillators with Human Design channels
 """
 
 import numpy as np
+from numpy.random import SFC64, default_rng
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from dataclasses import dataclass
 from datetime import datetime
 import json
 
+# Numba is optional - simulation falls back to the pure-Python integrator
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# CuPy is optional - large ensembles can integrate on the GPU
+try:
+    import cupy
+except ImportError:
+    cupy = None
+
 # ============================================================================
 # CENTER DEFINITIONS
 # ============================================================================
@@ -57,6 +71,240 @@ CHANNELS = [
     (1, 7, 0.4),   # Ajna-Spleen (awareness + intuition)
 ]
 
+# SoA views of the definitions above, built once at import so per-step
+# code works on arrays instead of re-walking the tuple list / dicts.
+# CHANNELS itself stays the source of truth for introspection.
+N_CENTERS = len(CENTERS)
+
+COUPLING = np.zeros((N_CENTERS, N_CENTERS))
+for _c1, _c2, _strength in CHANNELS:
+    COUPLING[_c1, _c2] = _strength
+    COUPLING[_c2, _c1] = _strength  # Symmetric
+
+FREQUENCIES = np.array([CENTERS[i]["frequency"] for i in range(N_CENTERS)])
+CENTER_NAMES = tuple(CENTERS[i]["name"] for i in range(N_CENTERS))
+CENTER_FIELDS = tuple(CENTERS[i]["field"] for i in range(N_CENTERS))
+CENTER_COLORS = tuple(CENTERS[i]["color"] for i in range(N_CENTERS))
+
+# CSR adjacency of CHANNELS (both directions, since coupling is symmetric).
+# Kernels iterating these arrays touch only the real edges rather than
+# scanning full rows of COUPLING, which matters if the center graph grows.
+_adj = [[] for _ in range(N_CENTERS)]
+for _c1, _c2, _strength in CHANNELS:
+    _adj[_c1].append((_c2, _strength))
+    _adj[_c2].append((_c1, _strength))
+_CSR_INDPTR = np.cumsum([0] + [len(_row) for _row in _adj]).astype(np.int64)
+_CSR_J = np.array([_j for _row in _adj for _j, _w in _row], dtype=np.int64)
+_CSR_W = np.array([_w for _row in _adj for _j, _w in _row])
+# Source-center index per edge (COO companion to the CSR arrays above)
+_EDGE_I = np.repeat(np.arange(N_CENTERS), np.diff(_CSR_INDPTR))
+del _adj
+
+# Field orderings shared by the flat state snapshot and its JSON form
+_COHERENCE_KEYS = ("body", "mind", "heart",
+                   "body_mind", "body_heart", "mind_heart", "global")
+_FIELD_NAMES = ("Body", "Mind", "Heart")
+
+# Maximum history entries retained by an oscillator (oldest drop off)
+HISTORY_CAPACITY = 4096
+
+_TWO_PI = 2 * np.pi
+
+
+class _RingHistory:
+    """
+    Fixed-capacity history backed by a preallocated array.
+    Appends are O(1) writes into the buffer; once capacity is reached the
+    oldest entries fall off, so long-running servers don't grow unboundedly.
+    Reads come back in chronological order.
+    """
+
+    def __init__(self, capacity: int, width: int = None, dtype=np.float64):
+        self.capacity = capacity
+        shape = (capacity,) if width is None else (capacity, width)
+        self._buf = np.empty(shape, dtype=dtype)
+        self._total = 0  # Total values ever written
+
+    def append(self, value):
+        self._buf[self._total % self.capacity] = value
+        self._total += 1
+
+    def extend(self, values):
+        values = np.asarray(values)
+        n = len(values)
+        if n == 0:
+            return
+        # Only the last `capacity` values can survive anyway
+        skip = max(0, n - self.capacity)
+        idx = (self._total + skip + np.arange(n - skip)) % self.capacity
+        self._buf[idx] = values[skip:]
+        self._total += n
+
+    def copy_from(self, other: "_RingHistory"):
+        """Adopt another ring's contents (same capacity and width)"""
+        self._buf[:] = other._buf
+        self._total = other._total
+
+    def as_array(self) -> np.ndarray:
+        """History in chronological order (oldest first)"""
+        if self._total <= self.capacity:
+            return self._buf[:self._total]
+        start = self._total % self.capacity
+        return self._buf[(start + np.arange(self.capacity)) % self.capacity]
+
+    def __len__(self):
+        return min(self._total, self.capacity)
+
+    def __getitem__(self, index):
+        return self.as_array()[index]
+
+    def __iter__(self):
+        return iter(self.as_array())
+
+
+# ============================================================================
+# JIT INTEGRATION KERNEL
+# ============================================================================
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _kuramoto_derivatives_nb(theta, omega, indptr, indices, weights, out):
+        """dθᵢ/dt = ωᵢ + Σⱼ Kᵢⱼ sin(θⱼ - θᵢ)  over CSR edges only"""
+        n = theta.shape[0]
+        for i in range(n):
+            s = omega[i]
+            for k in range(indptr[i], indptr[i + 1]):
+                s += weights[k] * np.sin(theta[indices[k]] - theta[i])
+            out[i] = s
+
+    @numba.njit(cache=True, fastmath=True)
+    def _rk4_step_nb(theta, omega, indptr, indices, weights, dt,
+                     k1, k2, k3, k4, stage):
+        """
+        One fused RK4 step: all four stage evaluations and the phase
+        update run in machine code, mutating theta in place.
+        Callers supply the scratch arrays so hot loops can reuse them.
+        """
+        n = theta.shape[0]
+        _kuramoto_derivatives_nb(theta, omega, indptr, indices, weights, k1)
+        for i in range(n):
+            stage[i] = theta[i] + 0.5 * dt * k1[i]
+        _kuramoto_derivatives_nb(stage, omega, indptr, indices, weights, k2)
+        for i in range(n):
+            stage[i] = theta[i] + 0.5 * dt * k2[i]
+        _kuramoto_derivatives_nb(stage, omega, indptr, indices, weights, k3)
+        for i in range(n):
+            stage[i] = theta[i] + dt * k3[i]
+        _kuramoto_derivatives_nb(stage, omega, indptr, indices, weights, k4)
+
+        # Per-step increments are far below 2π, so a conditional
+        # add/subtract (compiled to cmov) replaces elementwise fmod
+        two_pi = 2 * np.pi
+        for i in range(n):
+            t = theta[i] + (dt / 6.0) * (k1[i] + 2 * k2[i] + 2 * k3[i] + k4[i])
+            if t >= two_pi:
+                t -= two_pi
+            elif t < 0.0:
+                t += two_pi
+            theta[i] = t
+
+    @numba.njit(cache=True, fastmath=True)
+    def _kuramoto_evolve(theta, omega, indptr, indices, weights,
+                         dt, n_steps, record_interval, history):
+        """
+        Run n_steps of RK4 without returning to Python, mutating theta
+        in place and writing recorded phases into `history`.
+        Returns the number of records written.
+        """
+        n = theta.shape[0]
+        k1 = np.empty(n)
+        k2 = np.empty(n)
+        k3 = np.empty(n)
+        k4 = np.empty(n)
+        stage = np.empty(n)
+        rec = 0
+
+        for step in range(n_steps):
+            _rk4_step_nb(theta, omega, indptr, indices, weights, dt,
+                         k1, k2, k3, k4, stage)
+
+            if step % record_interval == 0:
+                history[rec] = theta
+                rec += 1
+
+        return rec
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _kuramoto_evolve_ensemble(thetas, omegas, indptr, indices, weights,
+                                  dt, n_steps, record_interval, histories):
+        """
+        Evolve M independent replicas, one per thread via prange.
+        A single 9-center system is too small to thread per step, so the
+        parallelism lives at the replica level instead.
+        """
+        for r in numba.prange(thetas.shape[0]):
+            _kuramoto_evolve(thetas[r], omegas[r], indptr, indices,
+                             weights[r], dt, n_steps, record_interval,
+                             histories[r])
+
+
+# Fastest available single-system kernels: the prebuilt AOT extension
+# (see _ern_aot.py) when it exists, otherwise the @njit dispatchers
+# above. The ensemble kernel stays JIT-only (prange is not exportable).
+_rk4_step_fast = _rk4_step_nb if numba is not None else None
+_kuramoto_evolve_fast = _kuramoto_evolve if numba is not None else None
+try:
+    from .ern_kernels import rk4_step as _rk4_step_fast
+    from .ern_kernels import kuramoto_evolve as _kuramoto_evolve_fast
+except ImportError:
+    pass
+
+
+# ============================================================================
+# STATE SNAPSHOT
+# ============================================================================
+
+@dataclass(slots=True)
+class OscillatorState:
+    """
+    Flat snapshot of an oscillator: plain arrays plus two indices, no
+    nested dicts or string keys. Serialize with to_json_dict() only at
+    the JSON boundary.
+    """
+    timestamp: str
+    phases: np.ndarray
+    activations: np.ndarray
+    coherence: np.ndarray       # ordered as _COHERENCE_KEYS
+    field_strengths: np.ndarray  # ordered as _FIELD_NAMES
+    dominant_idx: int
+
+    @property
+    def dominant_field(self) -> str:
+        return _FIELD_NAMES[self.dominant_idx]
+
+    def to_json_dict(self) -> dict:
+        """Materialize the string-keyed form used by LLM/GAN consumers"""
+        return {
+            "timestamp": self.timestamp,
+            "centers": {
+                CENTER_NAMES[i]: {
+                    "phase": float(self.phases[i]),
+                    "activation": float(self.activations[i]),
+                    "field": CENTER_FIELDS[i],
+                    "frequency": float(FREQUENCIES[i])
+                }
+                for i in range(N_CENTERS)
+            },
+            "coherence": {k: float(v)
+                          for k, v in zip(_COHERENCE_KEYS, self.coherence)},
+            "dominant_field": self.dominant_field,
+            "field_strengths": {k: float(v)
+                                for k, v in zip(_FIELD_NAMES,
+                                                self.field_strengths)}
+        }
+
+
 # ============================================================================
 # OSCILLATOR CLASS
 # ============================================================================
@@ -67,43 +315,67 @@ class ConsciousnessOscillator:
     Implements 12:16:40 temporal architecture
     """
     
-    def __init__(self, base_frequency=1.0, coupling_strength=0.3):
+    def __init__(self, base_frequency=1.0, coupling_strength=0.3, seed=None):
         """
         Initialize oscillator system
         
         Args:
             base_frequency: Base oscillation frequency (Body field = 1.0)
             coupling_strength: Global coupling strength multiplier
+            seed: Optional seed for this instance's RNG stream
         """
-        self.n_centers = 9
+        self.n_centers = N_CENTERS
         self.base_freq = base_frequency
         self.coupling_strength = coupling_strength
-        
-        # Initialize phases (random start)
-        self.phases = np.random.uniform(0, 2*np.pi, self.n_centers)
-        
+
+        # Per-instance Generator (SFC64): faster than the legacy global
+        # Mersenne Twister and gives ensemble replicas independent streams
+        self._rng = default_rng(SFC64(seed))
+
+        # Initialize phases (random start). float32 throughout: phases
+        # are bounded by the 2π wrap and downstream consumers
+        # (visualization, LLM prompts) only read ~3 decimals, so the
+        # halved memory traffic and doubled SIMD width are free wins
+        self.phases = self._rng.uniform(0, 2*np.pi, self.n_centers).astype(np.float32)
+
         # Natural frequencies from center definitions
-        self.natural_frequencies = np.array([
-            CENTERS[i]["frequency"] * base_frequency for i in range(self.n_centers)
-        ])
-        
+        self.natural_frequencies = (FREQUENCIES * base_frequency).astype(np.float32)
+
         # Build coupling matrix from channels
         self.coupling_matrix = self._build_coupling_matrix()
+
+        # Pre-scaled CSR edge weights for the JIT kernels
+        self._csr_weights = (_CSR_W * coupling_strength).astype(np.float32)
+
+        # Reusable RK4 scratch rows (k1..k4 + stage) so step() never
+        # allocates in the hot loop
+        self._rk4_scratch = np.empty((5, self.n_centers), dtype=np.float32)
+        
+        # History for visualization (ring buffers: bounded memory for
+        # long-lived processes, oldest entries drop off)
+        self.phase_history = _RingHistory(HISTORY_CAPACITY, self.n_centers,
+                                          dtype=np.float32)
+        self.coherence_history = _RingHistory(HISTORY_CAPACITY, dtype=np.float32)
+        self.time_history = _RingHistory(HISTORY_CAPACITY, dtype=np.float32)
+
+        # Lazily computed (sin(phases), exp(1j*phases)) shared by the
+        # coherence/activation readouts; reset whenever phases advance
+        self._trig_cache = None
         
-        # History for visualization
-        self.phase_history = []
-        self.coherence_history = []
-        self.time_history = []
-        
+    def _trig(self):
+        """
+        sin(phases) and exp(1j*phases) for the current state, computed
+        once and shared by every readout until the next integration step
+        (one exp yields both: z.imag is sin(phases)).
+        """
+        if self._trig_cache is None:
+            z = np.exp(1j * self.phases)
+            self._trig_cache = (z.imag, z)
+        return self._trig_cache
+
     def _build_coupling_matrix(self):
         """Build coupling matrix from Human Design channels"""
-        K = np.zeros((self.n_centers, self.n_centers))
-        
-        for c1, c2, strength in CHANNELS:
-            K[c1, c2] = strength * self.coupling_strength
-            K[c2, c1] = strength * self.coupling_strength  # Symmetric
-            
-        return K
+        return (COUPLING * self.coupling_strength).astype(np.float32)
     
     def kuramoto_derivatives(self, phases):
         """
@@ -116,19 +388,12 @@ class ConsciousnessOscillator:
         - ωᵢ = natural frequency of oscillator i
         - Kᵢⱼ = coupling strength between i and j
         """
-        dtheta = np.zeros(self.n_centers)
-        
-        for i in range(self.n_centers):
-            # Natural frequency term
-            dtheta[i] = self.natural_frequencies[i]
-            
-            # Coupling term (sum over all other oscillators)
-            for j in range(self.n_centers):
-                if i != j:
-                    coupling = self.coupling_matrix[i, j] * np.sin(phases[j] - phases[i])
-                    dtheta[i] += coupling
-                    
-        return dtheta
+        # Evaluate sin only on the real channel edges (symmetrized arrays
+        # built at import) and segment-sum the contributions back onto the
+        # centers; zero-coupling pairs never enter the computation
+        contrib = self._csr_weights * np.sin(phases[_CSR_J] - phases[_EDGE_I])
+        return self.natural_frequencies + np.bincount(
+            _EDGE_I, weights=contrib, minlength=self.n_centers)
     
     def step(self, dt=0.01):
         """
@@ -137,16 +402,39 @@ class ConsciousnessOscillator:
         Args:
             dt: Time step size
         """
-        # RK4 integration for smooth phase evolution
+        self._trig_cache = None
+        sk1, sk2, sk3, sk4, stage = self._rk4_scratch
+        if _rk4_step_fast is not None:
+            _rk4_step_fast(self.phases, self.natural_frequencies,
+                         _CSR_INDPTR, _CSR_J, self._csr_weights, dt,
+                         sk1, sk2, sk3, sk4, stage)
+            return
+
+        # RK4 integration for smooth phase evolution; stage points are
+        # built in the reused scratch row instead of fresh temporaries
         k1 = self.kuramoto_derivatives(self.phases)
-        k2 = self.kuramoto_derivatives(self.phases + 0.5*dt*k1)
-        k3 = self.kuramoto_derivatives(self.phases + 0.5*dt*k2)
-        k4 = self.kuramoto_derivatives(self.phases + dt*k3)
-        
-        self.phases += (dt/6.0) * (k1 + 2*k2 + 2*k3 + k4)
-        
-        # Wrap phases to [0, 2π]
-        self.phases = self.phases % (2 * np.pi)
+        np.multiply(k1, 0.5 * dt, out=stage)
+        stage += self.phases
+        k2 = self.kuramoto_derivatives(stage)
+        np.multiply(k2, 0.5 * dt, out=stage)
+        stage += self.phases
+        k3 = self.kuramoto_derivatives(stage)
+        np.multiply(k3, dt, out=stage)
+        stage += self.phases
+        k4 = self.kuramoto_derivatives(stage)
+
+        # Accumulate k1 + 2*k2 + 2*k3 + k4 in place
+        k2 += k3
+        k2 *= 2
+        k1 += k2
+        k1 += k4
+        k1 *= dt / 6.0
+        self.phases += k1
+        
+        # Wrap phases to [0, 2π]; per-step increments are far below 2π,
+        # so branchless conditional add/subtract replaces fmod
+        self.phases -= _TWO_PI * (self.phases >= _TWO_PI)
+        self.phases += _TWO_PI * (self.phases < 0)
         
     def calculate_coherence(self):
         """
@@ -158,43 +446,32 @@ class ConsciousnessOscillator:
         R = 0: Complete incoherence
         """
         # Complex order parameter
-        z = np.mean(np.exp(1j * self.phases))
-        R = np.abs(z)
-        
-        return R
+        _, phasors = self._trig()
+        return np.abs(np.mean(phasors))
     
     def calculate_field_coherence(self):
         """
         Calculate coherence within and between fields (Body, Mind, Heart)
         """
-        body_phases = self.phases[[6, 7, 8]]  # Sacral, Spleen, Root
-        mind_phases = self.phases[[0, 1, 2]]  # Head, Ajna, Throat
-        heart_phases = self.phases[[3, 4, 5]]  # G, Heart, Solar Plexus
-        
-        # Internal field coherence
-        body_coherence = np.abs(np.mean(np.exp(1j * body_phases)))
-        mind_coherence = np.abs(np.mean(np.exp(1j * mind_phases)))
-        heart_coherence = np.abs(np.mean(np.exp(1j * heart_phases)))
-        
-        # Cross-field phase differences
-        body_avg = np.angle(np.mean(np.exp(1j * body_phases)))
-        mind_avg = np.angle(np.mean(np.exp(1j * mind_phases)))
-        heart_avg = np.angle(np.mean(np.exp(1j * heart_phases)))
-        
+        return dict(zip(_COHERENCE_KEYS, self._coherence_vector()))
+
+    def _coherence_vector(self):
+        """Coherence values in _COHERENCE_KEYS order as one flat array"""
+        # One exp over all 9 phases; centers are ordered Mind (0-2),
+        # Heart (3-5), Body (6-8), so a reshape gives the per-field
+        # complex order parameters in a single grouped reduction
+        _, z = self._trig()
+        mind_z, heart_z, body_z = z.reshape(3, 3).mean(axis=1)
+
+        out = np.empty(7, dtype=np.float32)
+        out[0:3] = np.abs([body_z, mind_z, heart_z])
+        body_avg, mind_avg, heart_avg = np.angle([body_z, mind_z, heart_z])
         # Normalize phase differences to [0, 1]
-        diff_bm = 1 - abs(body_avg - mind_avg) / np.pi
-        diff_bh = 1 - abs(body_avg - heart_avg) / np.pi
-        diff_mh = 1 - abs(mind_avg - heart_avg) / np.pi
-        
-        return {
-            "body": body_coherence,
-            "mind": mind_coherence,
-            "heart": heart_coherence,
-            "body_mind": diff_bm,
-            "body_heart": diff_bh,
-            "mind_heart": diff_mh,
-            "global": self.calculate_coherence()
-        }
+        out[3] = 1 - abs(body_avg - mind_avg) / np.pi
+        out[4] = 1 - abs(body_avg - heart_avg) / np.pi
+        out[5] = 1 - abs(mind_avg - heart_avg) / np.pi
+        out[6] = np.abs(np.mean(z))
+        return out
     
     def get_field_activation(self):
         """
@@ -202,17 +479,17 @@ class ConsciousnessOscillator:
         Returns array of 9 center activations normalized to [0, 1]
         """
         # Convert phases to activation (using sine wave)
-        activations = (np.sin(self.phases) + 1) / 2  # Normalize to [0, 1]
-        return activations
+        sin_phases, _ = self._trig()
+        return (sin_phases + 1) / 2  # Normalize to [0, 1]
     
     def get_dominant_field(self):
         """Determine which field (Body/Mind/Heart) is currently dominant"""
         activations = self.get_field_activation()
-        
-        body_avg = np.mean(activations[[6, 7, 8]])
-        mind_avg = np.mean(activations[[0, 1, 2]])
-        heart_avg = np.mean(activations[[3, 4, 5]])
-        
+
+        # Same contiguous-field reshape used by the coherence code: one
+        # grouped mean, no per-group fancy-index temporaries
+        mind_avg, heart_avg, body_avg = activations.reshape(3, 3).mean(axis=1)
+
         field_strengths = {"Body": body_avg, "Mind": mind_avg, "Heart": heart_avg}
         dominant = max(field_strengths, key=field_strengths.get)
         
@@ -228,39 +505,151 @@ class ConsciousnessOscillator:
             record_interval: Record data every N steps
         """
         n_steps = int(duration / dt)
-        
-        for step in range(n_steps):
-            self.step(dt)
-            
-            # Record history
-            if step % record_interval == 0:
-                self.phase_history.append(self.phases.copy())
-                self.coherence_history.append(self.calculate_coherence())
-                self.time_history.append(step * dt)
-    
+        n_records = (n_steps + record_interval - 1) // record_interval
+        history = np.empty((n_records, self.n_centers), dtype=self.phases.dtype)
+
+        if _kuramoto_evolve_fast is not None:
+            # Entire integration runs inside the compiled kernel; history
+            # is post-processed in bulk afterwards
+            rec = _kuramoto_evolve_fast(
+                self.phases, self.natural_frequencies,
+                _CSR_INDPTR, _CSR_J, self._csr_weights,
+                dt, n_steps, record_interval, history
+            )
+        else:
+            rec = 0
+            for step in range(n_steps):
+                self.step(dt)
+                if step % record_interval == 0:
+                    history[rec] = self.phases
+                    rec += 1
+
+        self._trig_cache = None
+        self._record_batch(history[:rec], n_steps, dt, record_interval)
+
+    def _record_batch(self, history, n_steps, dt, record_interval):
+        """Bulk-append a block of recorded phases plus derived series"""
+        self.phase_history.extend(history)
+        coherence = np.abs(np.mean(np.exp(1j * history), axis=1))
+        self.coherence_history.extend(coherence)
+        self.time_history.extend(np.arange(0, n_steps, record_interval) * dt)
+    
+    def adopt_state(self, other: "ConsciousnessOscillator"):
+        """
+        Copy evolved state from another oscillator into this instance
+        in place - phases, histories and caches - so every holder of
+        this object (controllers, FairyGANmatter, visualizers) sees the
+        update. Used to merge results back from worker processes, which
+        evolve an unpickled copy rather than the original.
+        """
+        self.phases[:] = other.phases
+        self.phase_history.copy_from(other.phase_history)
+        self.coherence_history.copy_from(other.coherence_history)
+        self.time_history.copy_from(other.time_history)
+        self._trig_cache = None
+
+    def get_state(self) -> OscillatorState:
+        """Current state as a flat-array snapshot (no dict building)"""
+        activations = self.get_field_activation()
+        mind_s, heart_s, body_s = activations.reshape(3, 3).mean(axis=1)
+        strengths = np.array([body_s, mind_s, heart_s], dtype=np.float32)
+
+        return OscillatorState(
+            timestamp=datetime.now().isoformat(),
+            phases=self.phases,
+            activations=activations,
+            coherence=self._coherence_vector(),
+            field_strengths=strengths,
+            dominant_idx=int(np.argmax(strengths))
+        )
+
     def get_state_vector(self):
         """Get current state as dictionary for LLM/GAN integration"""
-        activations = self.get_field_activation()
-        coherence = self.calculate_field_coherence()
-        dominant, strengths = self.get_dominant_field()
-        
-        state = {
-            "timestamp": datetime.now().isoformat(),
-            "centers": {
-                CENTERS[i]["name"]: {
-                    "phase": float(self.phases[i]),
-                    "activation": float(activations[i]),
-                    "field": CENTERS[i]["field"],
-                    "frequency": CENTERS[i]["frequency"]
-                }
-                for i in range(self.n_centers)
-            },
-            "coherence": {k: float(v) for k, v in coherence.items()},
-            "dominant_field": dominant,
-            "field_strengths": {k: float(v) for k, v in strengths.items()}
-        }
-        
-        return state
+        return self.get_state().to_json_dict()
+
+
+# Ensembles below this size aren't worth a GPU round trip
+GPU_ENSEMBLE_MIN = 1000
+
+
+def _evolve_ensemble_batched(thetas, omegas, coupling, dt, n_steps,
+                             record_interval, xp=np):
+    """
+    RK4 over a whole (B, 9) ensemble with batched array ops.
+    `xp` is the array module (numpy or cupy); on cupy every stage is a
+    handful of GPU kernel launches covering all B replicas at once.
+    Returns (thetas, histories).
+    """
+    def derivs(ph):
+        diff = xp.sin(ph[:, None, :] - ph[:, :, None])
+        return omegas + xp.einsum('bij,bij->bi', coupling, diff)
+
+    n_records = (n_steps + record_interval - 1) // record_interval
+    histories = xp.empty((thetas.shape[0], n_records, thetas.shape[1]),
+                         dtype=thetas.dtype)
+    rec = 0
+    for step in range(n_steps):
+        k1 = derivs(thetas)
+        k2 = derivs(thetas + 0.5 * dt * k1)
+        k3 = derivs(thetas + 0.5 * dt * k2)
+        k4 = derivs(thetas + dt * k3)
+        thetas = (thetas + (dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4)) % _TWO_PI
+        if step % record_interval == 0:
+            histories[:, rec] = thetas
+            rec += 1
+    return thetas, histories[:, :rec]
+
+
+def simulate_ensemble(oscillators, duration=100, dt=0.01, record_interval=10):
+    """
+    Advance several oscillators through the same time window at once.
+
+    Large ensembles integrate as one batched computation on the GPU when
+    CuPy is available; with Numba present the replicas instead run in
+    parallel threads (prange over the ensemble); otherwise each
+    oscillator simulates sequentially. Each oscillator's phases and
+    histories are updated as if it had run simulate() itself.
+    """
+    if cupy is not None and len(oscillators) >= GPU_ENSEMBLE_MIN:
+        n_steps = int(duration / dt)
+        thetas = cupy.asarray(np.stack([osc.phases for osc in oscillators]))
+        omegas = cupy.asarray(
+            np.stack([osc.natural_frequencies for osc in oscillators]))
+        coupling = cupy.asarray(
+            np.stack([osc.coupling_matrix for osc in oscillators]))
+
+        thetas, histories = _evolve_ensemble_batched(
+            thetas, omegas, coupling, dt, n_steps, record_interval, xp=cupy)
+        thetas = cupy.asnumpy(thetas)
+        histories = cupy.asnumpy(histories)
+
+        for r, osc in enumerate(oscillators):
+            osc.phases[:] = thetas[r]
+            osc._trig_cache = None
+            osc._record_batch(histories[r], n_steps, dt, record_interval)
+        return
+
+    if numba is None or not oscillators:
+        for osc in oscillators:
+            osc.simulate(duration, dt, record_interval)
+        return
+
+    n_steps = int(duration / dt)
+    n_records = (n_steps + record_interval - 1) // record_interval
+    thetas = np.stack([osc.phases for osc in oscillators])
+    omegas = np.stack([osc.natural_frequencies for osc in oscillators])
+    weights = np.stack([osc._csr_weights for osc in oscillators])
+    histories = np.empty((len(oscillators), n_records, N_CENTERS),
+                         dtype=thetas.dtype)
+
+    _kuramoto_evolve_ensemble(thetas, omegas, _CSR_INDPTR, _CSR_J, weights,
+                              dt, n_steps, record_interval, histories)
+
+    for r, osc in enumerate(oscillators):
+        osc.phases[:] = thetas[r]
+        osc._trig_cache = None
+        osc._record_batch(histories[r], n_steps, dt, record_interval)
+
 
 # ============================================================================
 # VISUALIZATION
@@ -291,20 +680,20 @@ def create_visualizer(oscillator, duration=50, dt=0.01, interval=50):
     circle = plt.Circle((0, 0), 1, fill=False, color='gray', linestyle='--', alpha=0.3)
     ax_phase.add_patch(circle)
     
-    # Initialize phase points
-    phase_points = []
+    # Initialize phase points: one scatter collection instead of 9
+    # separate artists, so each frame updates all dots in one call
+    phase_scatter = ax_phase.scatter(
+        np.zeros(9), np.zeros(9), c=list(CENTER_COLORS), s=225)
     phase_labels = []
-    for i in range(9):
-        point, = ax_phase.plot([], [], 'o', color=CENTERS[i]["color"], 
-                              markersize=15, label=CENTERS[i]["name"])
-        phase_points.append(point)
-        
-        # Add text label
-        label = ax_phase.text(0, 0, CENTERS[i]["name"], 
+    for name in CENTER_NAMES:
+        label = ax_phase.text(0, 0, name, 
                             fontsize=8, ha='center', va='center')
         phase_labels.append(label)
     
-    ax_phase.legend(loc='upper right', fontsize=8)
+    legend_handles = [plt.Line2D([], [], linestyle='', marker='o',
+                                 color=color, label=name)
+                      for color, name in zip(CENTER_COLORS, CENTER_NAMES)]
+    ax_phase.legend(handles=legend_handles, loc='upper right', fontsize=8)
     ax_phase.grid(True, alpha=0.2)
     
     # Subplot 2: Field activation bars
@@ -315,10 +704,9 @@ def create_visualizer(oscillator, duration=50, dt=0.01, interval=50):
     ax_bars.set_xlabel('Center')
     ax_bars.set_ylabel('Activation')
     
-    bar_colors = [CENTERS[i]["color"] for i in range(9)]
-    bars = ax_bars.bar(range(9), [0]*9, color=bar_colors, alpha=0.7)
+    bars = ax_bars.bar(range(9), [0]*9, color=CENTER_COLORS, alpha=0.7)
     ax_bars.set_xticks(range(9))
-    ax_bars.set_xticklabels([CENTERS[i]["name"] for i in range(9)], 
+    ax_bars.set_xticklabels(CENTER_NAMES, 
                             rotation=45, ha='right', fontsize=8)
     ax_bars.grid(True, alpha=0.2, axis='y')
     
@@ -337,13 +725,14 @@ def create_visualizer(oscillator, duration=50, dt=0.01, interval=50):
     line_heart, = ax_coherence.plot([], [], color='#F39C12', label='Heart', alpha=0.7)
     ax_coherence.legend(loc='upper right')
     
-    coherence_data = {
-        "time": [],
-        "global": [],
-        "body": [],
-        "mind": [],
-        "heart": []
-    }
+    # Preallocated per-frame series (written by index in update);
+    # the lines get sliced views, so nothing is copied or regrown
+    n_frames = int(duration / (dt * 10))
+    time_buf = np.empty(n_frames, dtype=np.float32)
+    global_buf = np.empty(n_frames, dtype=np.float32)
+    body_buf = np.empty(n_frames, dtype=np.float32)
+    mind_buf = np.empty(n_frames, dtype=np.float32)
+    heart_buf = np.empty(n_frames, dtype=np.float32)
     
     # Subplot 4: State info
     ax_info = axes[1, 1]
@@ -361,16 +750,12 @@ def create_visualizer(oscillator, duration=50, dt=0.01, interval=50):
         for _ in range(10):  # Multiple steps per frame for smoother animation
             oscillator.step(dt)
         
-        # Update phase space
-        for i in range(9):
-            x = np.cos(oscillator.phases[i])
-            y = np.sin(oscillator.phases[i])
-            phase_points[i].set_data([x], [y])
-            
-            # Update label position
-            label_x = x * 1.15
-            label_y = y * 1.15
-            phase_labels[i].set_position((label_x, label_y))
+        # Update phase space: one vectorized cos/sin, one offsets update
+        xs = np.cos(oscillator.phases)
+        ys = np.sin(oscillator.phases)
+        phase_scatter.set_offsets(np.column_stack([xs, ys]))
+        for label, lx, ly in zip(phase_labels, 1.15 * xs, 1.15 * ys):
+            label.set_position((lx, ly))
         
         # Update activation bars
         activations = oscillator.get_field_activation()
@@ -381,16 +766,17 @@ def create_visualizer(oscillator, duration=50, dt=0.01, interval=50):
         current_time = frame * dt * 10
         field_coh = oscillator.calculate_field_coherence()
         
-        coherence_data["time"].append(current_time)
-        coherence_data["global"].append(field_coh["global"])
-        coherence_data["body"].append(field_coh["body"])
-        coherence_data["mind"].append(field_coh["mind"])
-        coherence_data["heart"].append(field_coh["heart"])
-        
-        line_global.set_data(coherence_data["time"], coherence_data["global"])
-        line_body.set_data(coherence_data["time"], coherence_data["body"])
-        line_mind.set_data(coherence_data["time"], coherence_data["mind"])
-        line_heart.set_data(coherence_data["time"], coherence_data["heart"])
+        time_buf[frame] = current_time
+        global_buf[frame] = field_coh["global"]
+        body_buf[frame] = field_coh["body"]
+        mind_buf[frame] = field_coh["mind"]
+        heart_buf[frame] = field_coh["heart"]
+
+        times = time_buf[:frame + 1]
+        line_global.set_data(times, global_buf[:frame + 1])
+        line_body.set_data(times, body_buf[:frame + 1])
+        line_mind.set_data(times, mind_buf[:frame + 1])
+        line_heart.set_data(times, heart_buf[:frame + 1])
         
         # Update info text
         dominant, strengths = oscillator.get_dominant_field()
@@ -406,12 +792,26 @@ def create_visualizer(oscillator, duration=50, dt=0.01, interval=50):
         
         info_text.set_text(info_str)
         
-        return phase_points + phase_labels + [line_global, line_body, line_mind, line_heart, info_text]
-    
-    # Create animation
-    n_frames = int(duration / (dt * 10))
-    anim = FuncAnimation(fig, update, frames=n_frames, 
-                        interval=interval, blit=False)
+        return [phase_scatter] + phase_labels + list(bars) + \
+               [line_global, line_body, line_mind, line_heart, info_text]
+
+    def init():
+        """Reset every animated artist so blitting starts from a clean base"""
+        phase_scatter.set_offsets(np.zeros((9, 2)))
+        for label in phase_labels:
+            label.set_position((0, 0))
+        for bar in bars:
+            bar.set_height(0)
+        for line in (line_global, line_body, line_mind, line_heart):
+            line.set_data([], [])
+        info_text.set_text('')
+        return [phase_scatter] + phase_labels + list(bars) + \
+               [line_global, line_body, line_mind, line_heart, info_text]
+
+    # Create animation; blitting redraws only the returned artists
+    # instead of re-rasterizing all four subplots every frame
+    anim = FuncAnimation(fig, update, frames=n_frames, init_func=init,
+                        interval=interval, blit=True)
     
     plt.tight_layout()
     return fig, anim
@@ -437,9 +837,9 @@ if __name__ == "__main__":
     
     print("\nCenter Configuration:")
     for i in range(9):
-        print(f"  {CENTERS[i]['name']:15s} | "
-              f"Field: {CENTERS[i]['field']:6s} | "
-              f"Frequency: {CENTERS[i]['frequency']:.2f}x")
+        print(f"  {CENTER_NAMES[i]:15s} | "
+              f"Field: {CENTER_FIELDS[i]:6s} | "
+              f"Frequency: {FREQUENCIES[i]:.2f}x")
     
     print(f"\nTemporal Ratios:")
     print(f"  Body  : Mind  : Heart")
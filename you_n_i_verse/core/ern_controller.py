@@ -17,12 +17,36 @@ This is a LIVING SYSTEM that breathes, adapts, and evolves.
 """
 
 import numpy as np
+import io
 import json
-from datetime import datetime
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from enum import IntEnum
 from typing import Dict, List, Tuple, Optional
 
+# Numba is optional - the update readout falls back to NumPy calls
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# orjson is optional - state serialization falls back to json.dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import our existing modules
-from .consciousness_oscillator import ConsciousnessOscillator, CENTERS
+from .consciousness_oscillator import (
+    ConsciousnessOscillator,
+    CENTERS,
+    CENTER_NAMES,
+)
 from ..engines.bioenergetic_geometry_engine import (
     generate_GAN_prompt,
     generate_LLM_tone_filter,
@@ -30,6 +54,89 @@ from ..engines.bioenergetic_geometry_engine import (
     FIELD_PERCEPTION
 )
 
+class Field(IntEnum):
+    """Canonical small-int codes for the consciousness fields"""
+    BODY = 0
+    MIND = 1
+    HEART = 2
+    SOUL = 3
+    SPIRIT = 4
+    SHADOW = 5
+    LIGHT = 6
+    VOID = 7
+    UNITY = 8
+
+
+# Display names by field code; the readout kernel only ever emits 0-2
+FIELD_NAMES = ("Body", "Mind", "Heart", "Soul", "Spirit",
+               "Shadow", "Light", "Void", "Unity")
+_FIELD_INDEX_BY_NAME = {name: i for i, name in enumerate(FIELD_NAMES)}
+
+# Anchor for converting monotonic_ns timestamps back to wall-clock time
+_MONOTONIC_EPOCH_NS = time.time_ns() - time.monotonic_ns()
+
+# Feedback entries kept in memory; older ones fall off the ring
+FEEDBACK_CAPACITY = 4096
+
+# Persistent state encoder: orjson with a cached option mask, or one
+# reusable JSONEncoder instead of a fresh one per json.dumps(indent=2)
+if orjson is not None:
+    _STATE_JSON_OPTS = orjson.OPT_INDENT_2
+else:
+    _STATE_JSON_ENCODE = json.JSONEncoder(indent=2).encode
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _field_readout_nb(phases, amplitudes):
+        """
+        Fused per-tick readout: writes activations into `amplitudes` and
+        returns (global coherence, dominant field index) in one pass over
+        the 9 phases instead of separate NumPy calls per quantity.
+        """
+        n = phases.shape[0]
+        re = 0.0
+        im = 0.0
+        mind = 0.0
+        heart = 0.0
+        body = 0.0
+        for i in range(n):
+            c = np.cos(phases[i])
+            si = np.sin(phases[i])
+            re += c
+            im += si
+            a = (si + 1.0) * 0.5
+            amplitudes[i] = a
+            if i < 3:
+                mind += a
+            elif i < 6:
+                heart += a
+            else:
+                body += a
+
+        coherence = np.sqrt(re * re + im * im) / n
+        dominant = 0
+        best = body
+        if mind > best:
+            best = mind
+            dominant = 1
+        if heart > best:
+            dominant = 2
+        return coherence, dominant
+
+
+# Prefer the prebuilt AOT kernel (see _ern_aot.py): same code, no JIT
+# compile or cache load in fresh processes
+_field_readout_fast = _field_readout_nb if numba is not None else None
+try:
+    from .ern_kernels import field_readout as _field_readout_fast
+except ImportError:
+    if _field_readout_fast is not None:
+        # Pay the JIT compile cost at import, not on the first update tick
+        _field_readout_fast(np.zeros(9, dtype=np.float32),
+                            np.empty(9, dtype=np.float32))
+
+
 # ============================================================================
 # ERN STATE CONTAINER
 # ============================================================================
@@ -45,16 +152,19 @@ class ERNState:
         self.birth_data = None
         self.natal_chart = None
         
-        # Time
-        self.current_time = datetime.now()
+        # Time: free-running simulation clock anchored at construction;
+        # wall-clock datetimes are derived only on demand
+        self.base_time = datetime.now()
+        self.tick = 0
+        self.sim_seconds = 0.0
         self.transit_data = None
         
         # Oscillator state
         self.oscillator = ConsciousnessOscillator()
         self.field_phases = None
-        self.field_amplitudes = None
+        self.field_amplitudes = np.zeros(9, dtype=np.float32)
         self.coherence = 0.0
-        self.dominant_field = None
+        self.dominant_field_idx = -1
         
         # Element activation
         self.active_elements = []
@@ -65,12 +175,12 @@ class ERNState:
         self.action_scores = {}
         
         # Output parameters
-        self.gan_params = {}
-        self.llm_params = {}
-        self.ui_params = {}
+        self.gan_params = GANParams()
+        self.llm_params = LLMParams()
+        self.ui_params = UIParams()
         
-        # Feedback history
-        self.feedback_history = []
+        # Feedback history: bounded ring, flat entries (no nested dicts)
+        self.feedback_history = deque(maxlen=FEEDBACK_CAPACITY)
         self.ru_weights = self._init_ru_weights()
         
         # Imbalance flags
@@ -81,16 +191,43 @@ class ERNState:
             "unity_collapse": False
         }
     
+    @property
+    def current_time(self):
+        """Wall-clock time of the current tick (base time + sim time)"""
+        return self.base_time + timedelta(seconds=self.sim_seconds)
+    
+    @property
+    def current_time_iso(self):
+        """ISO form of current_time, formatted only at the boundary"""
+        return self.current_time.isoformat()
+    
+    @property
+    def dominant_field(self):
+        """Display name of the dominant field (None before first update)"""
+        idx = self.dominant_field_idx
+        return FIELD_NAMES[idx] if idx >= 0 else None
+    
     def _init_ru_weights(self):
-        """Initialize Resonant Utility weights"""
-        return {
-            "progress": 1.0,
-            "friction": -0.5,
-            "coherence": 1.5,
-            "feasibility": 1.0,
-            "risk": -0.3,
-            "synergy": 1.2
-        }
+        """Initialize Resonant Utility weights (RU component order)"""
+        # progress, friction, coherence, feasibility, risk, synergy
+        return np.array([1.0, -0.5, 1.5, 1.0, -0.3, 1.2])
+    
+    def export_feedback_history(self) -> List[Dict]:
+        """Feedback history as display dicts, formatted only on export"""
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(
+                    (_MONOTONIC_EPOCH_NS + entry["timestamp_ns"]) / 1e9
+                ).isoformat(),
+                "feedback": entry["feedback"],
+                "state_snapshot": {
+                    "dominant_field": (FIELD_NAMES[entry["field_idx"]]
+                                       if entry["field_idx"] >= 0 else None),
+                    "coherence": entry["coherence"]
+                }
+            }
+            for entry in self.feedback_history
+        ]
 
 # ============================================================================
 # CHART DECODER (Sentence System Integration)
@@ -179,20 +316,24 @@ class ImbalanceDetector:
             "unity_collapse": False
         }
         
-        # Check field dominance (one field > 80% activation)
+        # One reduction serves both activation checks: max > 0.8 flags
+        # dominance, and max < 0.2 already means every field is < 0.2
         activations = state.oscillator.get_field_activation()
-        if np.max(activations) > 0.8:
+        amax = float(activations.max())
+
+        # Check field dominance (one field > 80% activation)
+        if amax > 0.8:
             flags["field_dominance"] = True
-        
+
         # Check coherence drop (global coherence < 0.3)
         if state.coherence < 0.3:
             flags["coherence_drop"] = True
-        
+
         # Check shadow spike (would need shadow center tracking)
         # TODO: Implement when shadow oscillator is added
-        
+
         # Check unity collapse (all fields < 0.2)
-        if np.all(activations < 0.2):
+        if amax < 0.2:
             flags["unity_collapse"] = True
         
         return flags
@@ -233,7 +374,18 @@ class ResonantUtilityEngine:
     """
     Scores possible actions/choices based on resonance with current field state
     """
-    
+
+    # Component order shared with ERNState.ru_weights, and the sampling
+    # bounds of the corresponding _calculate_* placeholders
+    _RU_COMPONENTS = ("progress", "friction", "coherence",
+                      "feasibility", "risk", "synergy")
+    _RU_LOW = np.array([0.0, 0.0, 0.0, 0.5, 0.0, 0.0])
+    _RU_HIGH = np.array([1.0, 0.5, 1.0, 1.0, 0.3, 1.0])
+    # +1 for factors that should grow with positive feedback, -1 for the
+    # penalty factors (friction, risk)
+    _RU_SIGN_MASK = np.array([1, -1, 1, 1, -1, 1], dtype=np.int8)
+    _rng = np.random.default_rng()
+
     @staticmethod
     def calculate_utility(
         action: str,
@@ -252,31 +404,32 @@ class ResonantUtilityEngine:
             Utility score (higher = more resonant)
         """
         score = 0.0
-        weights = state.ru_weights
+        w_progress, w_friction, w_coherence, w_feasibility, w_risk, w_synergy = \
+            state.ru_weights
         
         # Progress component (how much it moves toward goal)
         progress = ResonantUtilityEngine._calculate_progress(action, context)
-        score += weights["progress"] * progress
+        score += w_progress * progress
         
         # Friction component (resistance/difficulty)
         friction = ResonantUtilityEngine._calculate_friction(action, state)
-        score += weights["friction"] * friction
+        score += w_friction * friction
         
         # Coherence component (alignment with current field state)
         coherence_boost = ResonantUtilityEngine._calculate_coherence_boost(action, state)
-        score += weights["coherence"] * coherence_boost
+        score += w_coherence * coherence_boost
         
         # Feasibility component (practical doability)
         feasibility = ResonantUtilityEngine._calculate_feasibility(action, context)
-        score += weights["feasibility"] * feasibility
+        score += w_feasibility * feasibility
         
         # Risk component (potential downsides)
         risk = ResonantUtilityEngine._calculate_risk(action, context)
-        score += weights["risk"] * risk
+        score += w_risk * risk
         
         # Synergy component (how well elements combine)
         synergy = ResonantUtilityEngine._calculate_synergy(action, state)
-        score += weights["synergy"] * synergy
+        score += w_synergy * synergy
         
         return score
     
@@ -330,20 +483,125 @@ class ResonantUtilityEngine:
         Returns:
             List of (action, score) tuples, sorted by score (descending)
         """
-        scored_actions = [
-            (action, ResonantUtilityEngine.calculate_utility(action, state, context))
-            for action in actions
-        ]
-        
+        # Batch form of calculate_utility: one RNG draw gives the whole
+        # (N, 6) component matrix and one dot product applies the weights
+        engine = ResonantUtilityEngine
+        components = engine._rng.uniform(engine._RU_LOW, engine._RU_HIGH,
+                                         size=(len(actions), 6))
+        scores = components @ state.ru_weights
+
         # Sort by score (descending)
-        scored_actions.sort(key=lambda x: x[1], reverse=True)
-        
-        return scored_actions
+        order = np.argsort(-scores, kind="stable")
+        return [(actions[i], float(scores[i])) for i in order]
+
+# ============================================================================
+# ENSEMBLE SIMULATION
+# ============================================================================
+
+def _simulate_scenario(args):
+    """Worker: evolve one oscillator for a single chart scenario"""
+    birth_data, duration, dt, seed = args
+    oscillator = ConsciousnessOscillator(seed=seed)
+    # TODO: Seed phases/frequencies from the decoded chart once
+    # ChartDecoder grows a real ephemeris backend
+    oscillator.simulate(duration=duration, dt=dt)
+    return oscillator.get_state_vector()
+
+
+def simulate_ensemble(birth_data_list, duration=100, dt=0.01, max_workers=None):
+    """
+    Simulate many independent (birth_data, transit) scenarios in parallel
+
+    Each scenario is a separate process with its own oscillator and RNG
+    stream, so candidate action branches scale across CPU cores.
+
+    Returns:
+        Final state vectors, in the same order as birth_data_list
+    """
+    jobs = [(birth_data, duration, dt, seed)
+            for seed, birth_data in enumerate(birth_data_list)]
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(_simulate_scenario, jobs))
 
 # ============================================================================
 # FIELD RULE TABLE
 # ============================================================================
 
+# Static field-indexed modulation tables in Field code order: tuple
+# indexing instead of string hashing per lookup
+# Body: simple/direct .. Unity: maximum complexity/paradox
+_COMPLEXITY_BY_FIELD = (0.3, 0.8, 0.5, 0.6, 0.9, 0.4, 0.5, 0.2, 1.0)
+
+# (timbre, rhythm) musical qualities by field code
+_AUDIO_BY_FIELD = (
+    ("earthy", "steady"),          # Body
+    ("crystalline", "precise"),    # Mind
+    ("warm", "flowing"),           # Heart
+    ("ethereal", "undulating"),    # Soul
+    ("harmonic", "transcendent"),  # Spirit
+    ("dissonant", "irregular"),    # Shadow
+    ("bright", "clear"),           # Light
+    ("silent", "sparse"),          # Void
+    ("all", "paradoxical"),        # Unity
+)
+
+# Color palettes by field code (string keys resolved once at import)
+_PALETTE_BY_FIELD = tuple(
+    FIELD_PERCEPTION.get(_name, FIELD_PERCEPTION["Body"])["color_range"]
+    for _name in FIELD_NAMES
+)
+
+# Partially evaluated (constant, slope) pairs for the coherence-linear
+# parameter formulas; coherence is the only runtime variable, so each
+# scalar is one fused multiply-add from these tables. Plain tuples,
+# not ndarrays: at 2-3 elements the array dispatch costs ~8x the math.
+_UI_MOTION_SPEED = (0.5, 0.5)        # smoother when coherent
+_UI_CONTRAST = (0.3, 0.7)            # higher contrast when coherent
+_UI_VISUAL_COMPLEXITY = (1.0, -1.0)  # simpler when coherent
+_AUDIO_HARMONY = (0.0, 1.0)          # more harmonic when coherent
+_AUDIO_VOLUME = (0.5, 0.3)
+
+
+# Typed slotted containers for the per-tick output parameters: fixed
+# slot loads instead of dict churn, converted to dicts (asdict) only at
+# the JSON boundary
+@dataclass(slots=True)
+class GANParams:
+    prompt: str = ""
+    style_strength: float = 0.0
+    clarity: float = 0.0
+    color_saturation: float = 0.5
+
+
+@dataclass(slots=True)
+class LLMParams:
+    field: str = ""
+    base_tone: str = ""
+    perception_style: str = ""
+    # Immutable default; generate_output_params supplies the real list
+    element_influences: tuple = ()
+    coherence_modifier: str = ""
+    temperature: float = 1.0
+    complexity: float = 0.5
+
+
+@dataclass(slots=True)
+class UIParams:
+    motion_speed: float = 0.5
+    contrast: float = 0.3
+    visual_complexity: float = 1.0
+    color_palette: str = ""
+
+
+@dataclass(slots=True)
+class AudioParams:
+    timbre: str = "earthy"
+    rhythm: str = "steady"
+    harmony: float = 0.0
+    volume: float = 0.5
+
+
 class FieldRuleTable:
     """
     Maps field state → output modulation parameters
@@ -363,28 +621,36 @@ class FieldRuleTable:
                 'audio': Audio parameters
             }
         """
+        field_idx = state.dominant_field_idx
         dominant_field = state.dominant_field
         coherence = state.coherence
         active_elements = state.active_elements
         
         # Generate GAN parameters
-        gan_params = {
-            "prompt": generate_GAN_prompt(dominant_field, active_elements, coherence),
-            "style_strength": coherence,  # High coherence = strong style
-            "clarity": coherence,  # High coherence = clear images
-            "color_saturation": FieldRuleTable._map_coherence_to_saturation(coherence)
-        }
+        gan_params = GANParams(
+            prompt=generate_GAN_prompt(dominant_field, active_elements, coherence),
+            style_strength=coherence,  # High coherence = strong style
+            clarity=coherence,  # High coherence = clear images
+            color_saturation=FieldRuleTable._map_coherence_to_saturation(coherence)
+        )
         
         # Generate LLM parameters
-        llm_params = generate_LLM_tone_filter(dominant_field, active_elements, coherence)
-        llm_params["temperature"] = FieldRuleTable._map_coherence_to_temperature(coherence)
-        llm_params["complexity"] = FieldRuleTable._map_field_to_complexity(dominant_field)
+        tone_profile = generate_LLM_tone_filter(dominant_field, active_elements, coherence)
+        llm_params = LLMParams(
+            field=tone_profile["field"],
+            base_tone=tone_profile["base_tone"],
+            perception_style=tone_profile["perception_style"],
+            element_influences=tone_profile["element_influences"],
+            coherence_modifier=tone_profile["coherence_modifier"],
+            temperature=FieldRuleTable._map_coherence_to_temperature(coherence),
+            complexity=FieldRuleTable._map_field_to_complexity(field_idx)
+        )
         
         # Generate UI parameters
-        ui_params = FieldRuleTable._generate_ui_params(dominant_field, coherence)
+        ui_params = FieldRuleTable._generate_ui_params(field_idx, coherence)
         
         # Generate audio parameters
-        audio_params = FieldRuleTable._generate_audio_params(dominant_field, coherence)
+        audio_params = FieldRuleTable._generate_audio_params(field_idx, coherence)
         
         return {
             "gan": gan_params,
@@ -404,57 +670,36 @@ class FieldRuleTable:
         return 1.0 - 0.7 * coherence  # Range: [0.3, 1.0]
     
     @staticmethod
-    def _map_field_to_complexity(field: str) -> float:
+    def _map_field_to_complexity(field_idx: int) -> float:
         """Different fields prefer different complexity"""
-        complexity_map = {
-            "Body": 0.3,      # Simple, direct
-            "Mind": 0.8,      # Complex, analytical
-            "Heart": 0.5,     # Medium, poetic
-            "Soul": 0.6,      # Medium-high, rhythmic
-            "Spirit": 0.9,    # High, transcendent
-            "Shadow": 0.4,    # Low-medium, defensive
-            "Light": 0.5,     # Medium, clear
-            "Void": 0.2,      # Minimal
-            "Unity": 1.0      # Maximum complexity/paradox
-        }
-        return complexity_map.get(field, 0.5)
+        return _COMPLEXITY_BY_FIELD[field_idx] if field_idx >= 0 else 0.5
     
     @staticmethod
-    def _generate_ui_params(field: str, coherence: float) -> Dict:
-        """Generate UI/UX parameters"""
-        field_data = FIELD_PERCEPTION.get(field, FIELD_PERCEPTION["Body"])
-        
-        return {
-            "motion_speed": 0.5 + 0.5 * coherence,  # Smoother when coherent
-            "contrast": 0.3 + 0.7 * coherence,      # Higher contrast when coherent
-            "visual_complexity": 1.0 - coherence,   # Simpler when coherent
-            "color_palette": field_data["color_range"]
-        }
+    def _generate_ui_params(field_idx: int, coherence: float) -> UIParams:
+        """Generate UI/UX parameters from the specialized linear tables"""
+        palette = _PALETTE_BY_FIELD[field_idx] if field_idx >= 0 \
+            else _PALETTE_BY_FIELD[Field.BODY]
+        
+        return UIParams(
+            motion_speed=_UI_MOTION_SPEED[0] + _UI_MOTION_SPEED[1] * coherence,
+            contrast=_UI_CONTRAST[0] + _UI_CONTRAST[1] * coherence,
+            visual_complexity=(_UI_VISUAL_COMPLEXITY[0]
+                               + _UI_VISUAL_COMPLEXITY[1] * coherence),
+            color_palette=palette
+        )
     
     @staticmethod
-    def _generate_audio_params(field: str, coherence: float) -> Dict:
-        """Generate audio parameters"""
-        # Map fields to musical qualities
-        field_audio_map = {
-            "Body": {"timbre": "earthy", "rhythm": "steady"},
-            "Mind": {"timbre": "crystalline", "rhythm": "precise"},
-            "Heart": {"timbre": "warm", "rhythm": "flowing"},
-            "Soul": {"timbre": "ethereal", "rhythm": "undulating"},
-            "Spirit": {"timbre": "harmonic", "rhythm": "transcendent"},
-            "Shadow": {"timbre": "dissonant", "rhythm": "irregular"},
-            "Light": {"timbre": "bright", "rhythm": "clear"},
-            "Void": {"timbre": "silent", "rhythm": "sparse"},
-            "Unity": {"timbre": "all", "rhythm": "paradoxical"}
-        }
-        
-        audio_profile = field_audio_map.get(field, field_audio_map["Body"])
-        
-        return {
-            "timbre": audio_profile["timbre"],
-            "rhythm": audio_profile["rhythm"],
-            "harmony": coherence,  # More harmonic when coherent
-            "volume": 0.5 + 0.3 * coherence
-        }
+    def _generate_audio_params(field_idx: int, coherence: float) -> AudioParams:
+        """Generate audio parameters from the specialized linear tables"""
+        timbre, rhythm = _AUDIO_BY_FIELD[field_idx] if field_idx >= 0 \
+            else _AUDIO_BY_FIELD[Field.BODY]
+        
+        return AudioParams(
+            timbre=timbre,
+            rhythm=rhythm,
+            harmony=_AUDIO_HARMONY[0] + _AUDIO_HARMONY[1] * coherence,
+            volume=_AUDIO_VOLUME[0] + _AUDIO_VOLUME[1] * coherence
+        )
 
 # ============================================================================
 # FEEDBACK PROCESSOR
@@ -485,14 +730,14 @@ class FeedbackProcessor:
         Returns:
             Updated ERN state
         """
-        # Store feedback in history
+        # Store feedback in the ring; entries are flat (integer
+        # timestamp, field code, scalar coherence) and expand to display
+        # form only in ERNState.export_feedback_history
         state.feedback_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.monotonic_ns(),
             "feedback": feedback,
-            "state_snapshot": {
-                "dominant_field": state.dominant_field,
-                "coherence": state.coherence
-            }
+            "field_idx": state.dominant_field_idx,
+            "coherence": float(state.coherence)
         })
         
         # Update RU weights based on feedback
@@ -519,24 +764,16 @@ class FeedbackProcessor:
         # Simple learning rule: increase weights for positive outcomes
         learning_rate = 0.1
         
-        # Average feedback valence
-        avg_valence = np.mean([
-            feedback.get("emotional", 0),
-            feedback.get("intellectual", 0),
-            feedback.get("somatic", 0)
-        ])
-        
-        # Adjust weights (positive feedback → increase all weights slightly)
-        new_weights = current_weights.copy()
-        for key in new_weights:
-            if key in ["progress", "coherence", "synergy", "feasibility"]:
-                # Positive factors: increase when feedback is positive
-                new_weights[key] += learning_rate * avg_valence
-            else:
-                # Negative factors (friction, risk): decrease when feedback is positive
-                new_weights[key] -= learning_rate * avg_valence
+        # Average feedback valence (scalar arithmetic; no array allocation)
+        avg_valence = (feedback.get("emotional", 0)
+                       + feedback.get("intellectual", 0)
+                       + feedback.get("somatic", 0)) / 3.0
         
-        return new_weights
+        # Positive feedback grows the reward factors and shrinks the
+        # penalty factors: one fused vector op over the sign mask
+        return current_weights + (
+            learning_rate * avg_valence * ResonantUtilityEngine._RU_SIGN_MASK
+        )
 
 # ============================================================================
 # ERN CONTROLLER (Master Orchestrator)
@@ -556,16 +793,35 @@ class ERNController:
         self.rule_table = FieldRuleTable()
         self.feedback_processor = FeedbackProcessor()
         
+        # Minute-quantized transit memo: transits drift on the scale of
+        # minutes, so recomputing them at tick rate is wasted work
+        self._transit_cache_key = None
+        self._transit_cache_val = None
+        
         self.running = False
     
+    def _current_transits(self):
+        """Transit modulations for the current minute (memoized)"""
+        key = self.state.current_time.replace(second=0, microsecond=0)
+        if key != self._transit_cache_key:
+            self._transit_cache_val = self.chart_decoder.calculate_transits(
+                self.state.current_time,
+                self.state.natal_chart
+            )
+            self._transit_cache_key = key
+        return self._transit_cache_val
+    
     def initialize(self, birth_data: Dict):
         """
         Initialize the ERN with birth data
         """
         print("🌱 Initializing ERN...")
         
-        # Store birth data
+        # Store birth data and anchor the simulation clock
         self.state.birth_data = birth_data
+        self.state.base_time = datetime.now()
+        self.state.tick = 0
+        self.state.sim_seconds = 0.0
         
         # Decode natal chart
         self.state.natal_chart = self.chart_decoder.decode_natal_chart(birth_data)
@@ -581,24 +837,60 @@ class ERNController:
         Single update cycle of the ERN
         This runs continuously in a loop
         """
-        # 1. Calculate transits (time-based modulation)
-        self.state.current_time = datetime.now()
-        transit_mods = self.chart_decoder.calculate_transits(
-            self.state.current_time,
-            self.state.natal_chart
-        )
+        # 1. Advance the simulation clock (no syscall) and refresh
+        # transits for the new tick
+        self.state.tick += 1
+        self.state.sim_seconds += dt
+        transit_mods = self._current_transits()
         
         # TODO: Apply transit modulations to oscillator
         
         # 2. Step oscillator forward
         self.state.oscillator.step(dt)
-        
+
+        # 3-6. Refresh everything derived from the oscillator state
+        self._refresh_derived_state()
+
+    def advance(self, total_dt: float, dt: float = 0.01):
+        """
+        Advance the network by total_dt of simulated time in one call
+
+        All substeps integrate inside the oscillator's JIT kernel; the
+        derived state (amplitudes, coherence, imbalances, output params)
+        refreshes once at the end rather than per tick. Use this instead
+        of calling update() in a Python loop when only the final state
+        matters.
+        """
+        n_steps = max(1, int(round(total_dt / dt)))
+        self.state.tick += n_steps
+        self.state.sim_seconds += total_dt
+        transit_mods = self._current_transits()
+
+        # TODO: Apply transit modulations to oscillator
+
+        self.state.oscillator.simulate(duration=total_dt, dt=dt,
+                                       record_interval=n_steps)
+
+        self._refresh_derived_state()
+
+    def _refresh_derived_state(self):
+        """Steps 3-6 of the loop: read out the oscillator and remap outputs"""
+        oscillator = self.state.oscillator
+
         # 3. Update state from oscillator
-        self.state.field_phases = self.state.oscillator.phases
-        self.state.field_amplitudes = self.state.oscillator.get_field_activation()
-        field_coherence = self.state.oscillator.calculate_field_coherence()
-        self.state.coherence = field_coherence["global"]
-        self.state.dominant_field, _ = self.state.oscillator.get_dominant_field()
+        self.state.field_phases = oscillator.phases
+        if _field_readout_fast is not None:
+            # Single fused kernel: amplitudes + coherence + dominant field
+            coherence, dominant_idx = _field_readout_fast(
+                oscillator.phases, self.state.field_amplitudes)
+            self.state.coherence = coherence
+            self.state.dominant_field_idx = int(dominant_idx)
+        else:
+            self.state.field_amplitudes = oscillator.get_field_activation()
+            field_coherence = oscillator.calculate_field_coherence()
+            self.state.coherence = field_coherence["global"]
+            dominant_name, _ = oscillator.get_dominant_field()
+            self.state.dominant_field_idx = _FIELD_INDEX_BY_NAME[dominant_name]
         
         # 4. Detect imbalances
         self.state.imbalance_flags = self.imbalance_detector.detect_imbalances(self.state)
@@ -649,43 +941,55 @@ class ERNController:
         
         print(f"🌊 ERN loop starting... ({steps} steps)")
         
-        for step in range(steps):
+        # Status lines accumulate in memory and flush once at the end, so
+        # the hot loop carries no per-step modulo test or stdout syscalls
+        buf = io.StringIO()
+        for block_start in range(0, steps, 100):
             if not self.running:
                 break
             
             self.update(dt)
+            buf.write(f"Step {block_start}: Field={self.state.dominant_field}, Coherence={self.state.coherence:.3f}\n")
             
-            # Print status every 100 steps
-            if step % 100 == 0:
-                print(f"Step {step}: Field={self.state.dominant_field}, Coherence={self.state.coherence:.3f}")
+            # Remaining steps of this status block
+            for _ in range(min(100, steps - block_start) - 1):
+                if not self.running:
+                    break
+                self.update(dt)
         
+        sys.stdout.write(buf.getvalue())
         print("✅ ERN loop complete")
     
     def stop(self):
         """Stop the ERN loop"""
         self.running = False
     
-    def get_state_json(self) -> str:
+    def get_state_dict(self) -> Dict:
         """
-        Get current state as JSON for API/visualization
+        Get current state as a plain dict for in-process consumers
         """
-        state_dict = {
-            "timestamp": datetime.now().isoformat(),
+        return {
+            "timestamp": self.state.current_time_iso,
             "dominant_field": self.state.dominant_field,
             "coherence": float(self.state.coherence),
-            "field_amplitudes": {
-                CENTERS[i]["name"]: float(self.state.field_amplitudes[i])
-                for i in range(9)
-            },
+            "field_amplitudes": dict(
+                zip(CENTER_NAMES, self.state.field_amplitudes.tolist())),
             "imbalance_flags": self.state.imbalance_flags,
             "output_params": {
-                "gan": self.state.gan_params,
-                "llm": self.state.llm_params,
-                "ui": self.state.ui_params
+                "gan": asdict(self.state.gan_params),
+                "llm": asdict(self.state.llm_params),
+                "ui": asdict(self.state.ui_params)
             }
         }
-        
-        return json.dumps(state_dict, indent=2)
+
+    def get_state_json(self) -> str:
+        """
+        Get current state as JSON for API/visualization
+        """
+        state_dict = self.get_state_dict()
+        if orjson is not None:
+            return orjson.dumps(state_dict, option=_STATE_JSON_OPTS).decode()
+        return _STATE_JSON_ENCODE(state_dict)
 
 # ============================================================================
 # EXAMPLE USAGE
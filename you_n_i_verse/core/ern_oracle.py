@@ -12,8 +12,213 @@ The answer depends on:
 """
 
 import numpy as np
+import re
+from dataclasses import dataclass, fields
 from datetime import datetime
-from .ern_controller import ERNController
+from functools import cached_property
+from .ern_controller import ERNController, FIELD_NAMES
+
+# numba is optional - resonance scoring falls back to plain NumPy
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# ============================================================================
+# KEYWORD PATTERNS
+# ============================================================================
+
+# One compiled DFA pass per category instead of a Python loop of
+# substring probes per keyword
+_ACTION_RE = re.compile(r"\b(?:should|can|will|start|begin|try|go|do)\b")
+_CAUTION_RE = re.compile(r"\b(?:risky|dangerous|uncertain|worried|afraid)\b")
+_NEGATIVE_RE = re.compile(r"\b(?:not|don't|shouldn't|won't|can't)\b")
+
+
+def _extract_features(question: str) -> tuple:
+    """
+    (has_action, has_caution, has_negative, has_qmark) for a question:
+    one lowercase pass and one compiled scan per category, shared by the
+    single and batch scoring paths
+    """
+    question_lower = question.lower()
+    return (
+        _ACTION_RE.search(question_lower) is not None,
+        _CAUTION_RE.search(question_lower) is not None,
+        _NEGATIVE_RE.search(question_lower) is not None,
+        "?" in question,
+    )
+
+# ============================================================================
+# FIELD BIASES
+# ============================================================================
+
+# Bias arrays below are ordered by the controller's Field codes
+# (FIELD_NAMES order)
+
+# YES bias: Body likes action, Heart says yes to connection, Spirit
+# trusts the flow; Mind is cautious, Shadow defensive, Void empty
+_FIELD_YES_BIAS = np.array(
+    [0.1, -0.05, 0.15, 0.0, 0.2, -0.3, 0.1, -0.1, 0.0])
+# NO bias mirrors the same temperaments in the other direction
+_FIELD_NO_BIAS = np.array(
+    [-0.1, 0.15, -0.15, 0.0, -0.2, 0.3, -0.1, 0.1, 0.0])
+
+# Per-feature score weights in (action, caution, negative, qmark) order,
+# for the batched path: score adjustments become one matrix product
+_YES_FEATURE_W = np.array([0.1, 0.0, 0.0, -0.05])
+_NO_FEATURE_W = np.array([0.0, 0.15, 0.1, 0.0])
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _resonance_scores_nb(field_idx, coherence, has_action, has_caution,
+                             has_negative, has_qmark, noise_yes, noise_no,
+                             yes_bias, no_bias):
+        """Pure-arithmetic half of the resonance scoring: no dict hashing"""
+        yes = 0.5
+        no = 0.5
+        if field_idx >= 0:
+            yes += yes_bias[field_idx]
+            no += no_bias[field_idx]
+        
+        # High coherence favors a confident YES; low coherence breeds
+        # cautious NO
+        yes += coherence * 0.2
+        no += (1.0 - coherence) * 0.15
+        
+        if has_action:
+            yes += 0.1
+        if has_qmark:
+            yes -= 0.05
+        if has_caution:
+            no += 0.15
+        if has_negative:
+            no += 0.1
+        
+        yes += noise_yes
+        no += noise_no
+        
+        # Clamp both to [0, 1]
+        return (min(1.0, max(0.0, yes)), min(1.0, max(0.0, no)))
+
+
+# Prefer the prebuilt AOT kernel (see _ern_aot.py): same code, no JIT
+# compile or cache load in fresh processes
+_resonance_scores_fast = _resonance_scores_nb if numba is not None else None
+try:
+    from .ern_kernels import resonance_scores as _resonance_scores_fast
+except ImportError:
+    if _resonance_scores_fast is not None:
+        # Warm the kernel at import so the first question pays no JIT cost
+        _resonance_scores_fast(0, 0.5, True, False, False, True, 0.0, 0.0,
+                               _FIELD_YES_BIAS, _FIELD_NO_BIAS)
+
+# ============================================================================
+# REASONING TABLE
+# ============================================================================
+
+# Flat (field, answer) -> template lookup, built once at import. One hash
+# probe per question instead of rebuilding a nested dict of f-strings.
+_REASONING_TABLE = {
+    ("Body", "YES"): "Your body says YES. With {coherence:.2f} coherence, the physical intuition is clear. Trust the somatic knowing.",
+    ("Body", "NO"): "Your body says NO. At {coherence:.2f} coherence, there's a felt sense that this isn't right. Listen to the body.",
+    ("Mind", "YES"): "The analytical mind says YES. At {coherence:.2f} coherence, the logic supports this path. The pattern is clear.",
+    ("Mind", "NO"): "The mind advises NO. With {coherence:.2f} coherence, careful analysis suggests caution here. Think it through.",
+    ("Heart", "YES"): "Your heart says YES. At {coherence:.2f} coherence, there's emotional resonance here. Follow what you love.",
+    ("Heart", "NO"): "Your heart says NO. With {coherence:.2f} coherence, the emotional field doesn't align. Listen to your feelings.",
+    ("Soul", "YES"): "The soul vibrates YES. At {coherence:.2f} coherence, this aligns with your deeper rhythm. Trust the pulse.",
+    ("Soul", "NO"): "The soul says NO. At {coherence:.2f} coherence, this disrupts your natural frequency. Stay attuned.",
+    ("Spirit", "YES"): "Spirit says YES. At {coherence:.2f} coherence, this serves the highest good. Trust the divine flow.",
+    ("Spirit", "NO"): "Spirit says NO. At {coherence:.2f} coherence, this doesn't serve your evolution. Release it.",
+    ("Shadow", "YES"): "Even the shadow says YES, surprisingly. At {coherence:.2f} coherence, even your defenses see value here.",
+    ("Shadow", "NO"): "The shadow says NO. At {coherence:.2f} coherence, protective instincts are warning you. Stay guarded.",
+    ("Light", "YES"): "The light illuminates YES. At {coherence:.2f} coherence, clarity reveals this as aligned. Proceed with awareness.",
+    ("Light", "NO"): "The light reveals NO. At {coherence:.2f} coherence, truth-seeing shows this isn't the way. Choose differently.",
+    ("Void", "YES"): "From the void comes YES. At {coherence:.2f} coherence, emptiness paradoxically supports this. Trust the silence.",
+    ("Void", "NO"): "The void says NO. At {coherence:.2f} coherence, spaciousness reveals this fills no true need. Let it go.",
+    ("Unity", "YES"): "Unity consciousness says YES. At {coherence:.2f} coherence, all perspectives converge on affirmation. All is one.",
+    ("Unity", "NO"): "Unity consciousness says NO. At {coherence:.2f} coherence, the whole sees this creates separation. Return to oneness.",
+}
+
+_DEFAULT_REASONING = "The {field} field resonates with {answer} at {coherence:.2f} coherence."
+
+_UNCLEAR_REASONING = (
+    "The field is torn between YES ({yes_score:.2f}) and NO ({no_score:.2f}). "
+    "The {field} field at {coherence:.2f} coherence cannot decide clearly. "
+    "Perhaps rephrase your question or wait for the field to shift."
+)
+
+_NOISE_BUF_SIZE = 65536  # power of two so the rolling index can mask
+
+# Indexed by min(4, int(confidence * 5)) - replaces the if/elif ladder
+_CONFIDENCE_QUALIFIERS = (
+    "This is a WEAK signal - consider asking again.",
+    "This is a WEAK signal - consider asking again.",
+    "This is a MODERATE signal.",
+    "This is a CLEAR signal.",
+    "This is a STRONG signal.",
+)
+
+def _build_reasoning(
+    answer: str, confidence: float, field: str,
+    coherence: float, yes_score: float, no_score: float
+) -> str:
+    """
+    Generate human-readable reasoning for an answer
+    """
+    if answer == "UNCLEAR":
+        return _UNCLEAR_REASONING.format(
+            yes_score=yes_score, no_score=no_score,
+            field=field, coherence=coherence
+        )
+    
+    # Single flat lookup instead of nested dicts rebuilt per call
+    template = _REASONING_TABLE.get((field, answer))
+    if template is not None:
+        base_reasoning = template.format(coherence=coherence)
+    else:
+        base_reasoning = _DEFAULT_REASONING.format(
+            field=field, answer=answer, coherence=coherence
+        )
+    
+    # Confidence qualifier via direct index, no branch ladder
+    confidence_text = _CONFIDENCE_QUALIFIERS[min(4, int(confidence * 5))]
+    
+    return f"{base_reasoning} {confidence_text} (Confidence: {confidence:.0%})"
+
+
+# ============================================================================
+# ORACLE RESULT
+# ============================================================================
+
+@dataclass
+class OracleResult:
+    """
+    One answered question. The reasoning text is a cached property so
+    callers that only inspect `answer` never pay for string formatting;
+    the mapping protocol (keys/__getitem__) keeps dict-style access and
+    **-unpacking working for existing consumers.
+    """
+    timestamp: str
+    question: str
+    answer: str
+    confidence: float
+    field: str
+    coherence: float
+    yes_score: float
+    no_score: float
+
+    @cached_property
+    def reasoning(self) -> str:
+        return _build_reasoning(self.answer, self.confidence, self.field,
+                                self.coherence, self.yes_score, self.no_score)
+
+    def keys(self):
+        return [f.name for f in fields(self)] + ["reasoning"]
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
 
 # ============================================================================
 # YES/NO ORACLE
@@ -27,6 +232,26 @@ class ERNOracle:
     def __init__(self):
         self.ern = ERNController()
         self.question_history = []
+        
+        # Pregenerated Gaussian noise (sigma 0.1) consumed via a rolling
+        # index: one vectorized fill instead of a scalar draw per question
+        self._noise_rng = np.random.default_rng()
+        self._noise_buf = np.empty(_NOISE_BUF_SIZE, dtype=np.float32)
+        self._refill_noise()
+    
+    def _refill_noise(self):
+        """Refill the noise buffer in one vectorized draw"""
+        self._noise_rng.standard_normal(out=self._noise_buf, dtype=np.float32)
+        self._noise_buf *= 0.1
+        self._noise_idx = 0
+    
+    def _next_noise(self) -> float:
+        """Next pregenerated noise sample (quantum uncertainty term)"""
+        noise = float(self._noise_buf[self._noise_idx])
+        self._noise_idx = (self._noise_idx + 1) & (_NOISE_BUF_SIZE - 1)
+        if self._noise_idx == 0:
+            self._refill_noise()
+        return noise
     
     def initialize(self, birth_data):
         """Initialize with birth data"""
@@ -47,20 +272,19 @@ class ERNOracle:
                 'coherence': float
             }
         """
-        # Update oscillator state (let it breathe)
-        for _ in range(50):
-            self.ern.update(dt=0.01)
-        
-        # Get current state
-        import json
-        state = json.loads(self.ern.get_state_json())
+        # Update oscillator state (let it breathe); all 50 substeps run
+        # inside the controller's single advance call
+        self.ern.advance(0.5, dt=0.01)
         
-        dominant_field = state["dominant_field"]
-        coherence = state["coherence"]
+        # Read current state directly; get_state_json stays for the
+        # external API surface
+        field_idx = self.ern.state.dominant_field_idx
+        dominant_field = self.ern.state.dominant_field
+        coherence = float(self.ern.state.coherence)
         
         # Calculate resonance scores for YES and NO
-        yes_score = self._calculate_yes_resonance(question, dominant_field, coherence)
-        no_score = self._calculate_no_resonance(question, dominant_field, coherence)
+        yes_score, no_score = self._resonance_scores(
+            question, field_idx, coherence)
         
         # Determine answer
         if abs(yes_score - no_score) < 0.2:
@@ -74,190 +298,125 @@ class ERNOracle:
             answer = "NO"
             confidence = min(1.0, no_score / (yes_score + no_score))
         
-        # Generate reasoning
-        reasoning = self._generate_reasoning(
-            answer, confidence, dominant_field, coherence, yes_score, no_score
+        # Store in history (advance() just refreshed the cached ISO
+        # time); reasoning text is built lazily on first access
+        result = OracleResult(
+            timestamp=self.ern.state.current_time_iso,
+            question=question,
+            answer=answer,
+            confidence=confidence,
+            field=dominant_field,
+            coherence=coherence,
+            yes_score=yes_score,
+            no_score=no_score
         )
         
-        # Store in history
-        result = {
-            "timestamp": datetime.now().isoformat(),
-            "question": question,
-            "answer": answer,
-            "confidence": confidence,
-            "reasoning": reasoning,
-            "field": dominant_field,
-            "coherence": coherence,
-            "yes_score": yes_score,
-            "no_score": no_score
-        }
-        
         self.question_history.append(result)
         
         return result
     
-    def _calculate_yes_resonance(self, question: str, field: str, coherence: float) -> float:
+    def ask_many(self, questions: list) -> list:
         """
-        Calculate resonance score for YES
-        Higher score = YES is more resonant
+        Answer a batch of YES/NO questions in one vectorized pass
+        
+        The oscillator advances once for the whole batch and every
+        question is scored against that snapshot; noise, score vectors
+        and confidences are computed across the question axis in single
+        ndarray ops instead of per-question scalar math.
+        
+        Returns a list of OracleResult in question order.
         """
-        # Base score starts at 0.5 (neutral)
-        score = 0.5
-        
-        # Field-specific biases
-        field_yes_bias = {
-            "Body": 0.1,      # Body likes action (YES)
-            "Mind": -0.05,    # Mind wants to analyze (cautious)
-            "Heart": 0.15,    # Heart says yes to connection
-            "Soul": 0.0,      # Soul is neutral
-            "Spirit": 0.2,    # Spirit trusts the flow (YES)
-            "Shadow": -0.3,   # Shadow is defensive (NO)
-            "Light": 0.1,     # Light clarifies (slight YES)
-            "Void": -0.1,     # Void prefers emptiness (slight NO)
-            "Unity": 0.0      # Unity sees both
-        }
-        
-        score += field_yes_bias.get(field, 0.0)
-        
-        # Coherence effect: high coherence = more confident YES
-        score += coherence * 0.2
-        
-        # Question analysis (simple keyword detection)
-        question_lower = question.lower()
-        
-        # Action words increase YES
-        action_words = ["should", "can", "will", "start", "begin", "try", "go", "do"]
-        for word in action_words:
-            if word in question_lower:
-                score += 0.1
-                break
-        
-        # Question marks decrease certainty
-        if "?" in question:
-            score -= 0.05
-        
-        # Add some randomness (representing quantum uncertainty)
-        score += np.random.normal(0, 0.1)
-        
-        # Clamp to [0, 1]
-        return max(0, min(1, score))
+        if not questions:
+            return []
+        n = len(questions)
+        
+        self.ern.advance(0.5, dt=0.01)
+        field_idx = self.ern.state.dominant_field_idx
+        dominant_field = self.ern.state.dominant_field
+        coherence = float(self.ern.state.coherence)
+        
+        # Keyword features: one compiled-regex pass per category/question
+        features = np.array([_extract_features(q) for q in questions],
+                            dtype=np.float64)
+        
+        # One RNG call for all quantum-uncertainty terms
+        noise = self._noise_rng.standard_normal((n, 2)) * 0.1
+        
+        yes_bias = _FIELD_YES_BIAS[field_idx] if field_idx >= 0 else 0.0
+        no_bias = _FIELD_NO_BIAS[field_idx] if field_idx >= 0 else 0.0
+        yes = (0.5 + yes_bias + coherence * 0.2
+               + features @ _YES_FEATURE_W + noise[:, 0])
+        no = (0.5 + no_bias + (1.0 - coherence) * 0.15
+              + features @ _NO_FEATURE_W + noise[:, 1])
+        np.clip(yes, 0.0, 1.0, out=yes)
+        np.clip(no, 0.0, 1.0, out=no)
+        
+        # Vectorized decision rule (same thresholds as ask)
+        diff = np.abs(yes - no)
+        unclear = diff < 0.2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            winner_conf = np.minimum(1.0, np.maximum(yes, no) / (yes + no))
+        confidence = np.where(unclear, 0.5 - diff * 0.5, winner_conf)
+        
+        timestamp = self.ern.state.current_time_iso
+        results = []
+        for i, question in enumerate(questions):
+            if unclear[i]:
+                answer = "UNCLEAR"
+            elif yes[i] > no[i]:
+                answer = "YES"
+            else:
+                answer = "NO"
+            results.append(OracleResult(
+                timestamp=timestamp,
+                question=question,
+                answer=answer,
+                confidence=float(confidence[i]),
+                field=dominant_field,
+                coherence=coherence,
+                yes_score=float(yes[i]),
+                no_score=float(no[i])
+            ))
+        
+        self.question_history.extend(results)
+        return results
     
-    def _calculate_no_resonance(self, question: str, field: str, coherence: float) -> float:
+    def _resonance_scores(self, question: str, field_idx: int,
+                          coherence: float) -> tuple:
         """
-        Calculate resonance score for NO
-        Higher score = NO is more resonant
+        Calculate resonance scores for YES and NO in one pass
+        Higher score = that answer is more resonant
         """
-        # Base score starts at 0.5 (neutral)
-        score = 0.5
-        
-        # Field-specific biases
-        field_no_bias = {
-            "Body": -0.1,     # Body likes action (less NO)
-            "Mind": 0.15,     # Mind wants caution (MORE NO)
-            "Heart": -0.15,   # Heart is open (less NO)
-            "Soul": 0.0,      # Soul is neutral
-            "Spirit": -0.2,   # Spirit trusts (less NO)
-            "Shadow": 0.3,    # Shadow is defensive (MORE NO)
-            "Light": -0.1,    # Light clarifies (less NO)
-            "Void": 0.1,      # Void prefers emptiness (more NO)
-            "Unity": 0.0      # Unity sees both
-        }
-        
-        score += field_no_bias.get(field, 0.0)
-        
-        # Low coherence = more uncertain = more NO (caution)
-        score += (1 - coherence) * 0.15
-        
-        # Question analysis
-        question_lower = question.lower()
-        
-        # Caution words increase NO
-        caution_words = ["risky", "dangerous", "uncertain", "worried", "afraid"]
-        for word in caution_words:
-            if word in question_lower:
-                score += 0.15
-                break
-        
-        # Negative phrasing increases NO
-        negative_words = ["not", "don't", "shouldn't", "won't", "can't"]
-        for word in negative_words:
-            if word in question_lower:
-                score += 0.1
-                break
-        
-        # Add some randomness
-        score += np.random.normal(0, 0.1)
-        
-        # Clamp to [0, 1]
-        return max(0, min(1, score))
+        # Keyword scan once per question
+        has_action, has_caution, has_negative, has_qmark = \
+            _extract_features(question)
+        
+        # Quantum uncertainty terms (YES drawn first, as before)
+        noise_yes = self._next_noise()
+        noise_no = self._next_noise()
+        
+        if _resonance_scores_fast is not None:
+            return _resonance_scores_fast(
+                field_idx, coherence, has_action, has_caution,
+                has_negative, has_qmark, noise_yes, noise_no,
+                _FIELD_YES_BIAS, _FIELD_NO_BIAS)
+        
+        # Fallback: same arithmetic in plain Python
+        yes = 0.5 + coherence * 0.2 + noise_yes
+        no = 0.5 + (1.0 - coherence) * 0.15 + noise_no
+        if field_idx >= 0:
+            yes += _FIELD_YES_BIAS[field_idx]
+            no += _FIELD_NO_BIAS[field_idx]
+        if has_action:
+            yes += 0.1
+        if has_qmark:
+            yes -= 0.05
+        if has_caution:
+            no += 0.15
+        if has_negative:
+            no += 0.1
+        return (min(1.0, max(0.0, yes)), min(1.0, max(0.0, no)))
     
-    def _generate_reasoning(
-        self, answer: str, confidence: float, field: str, 
-        coherence: float, yes_score: float, no_score: float
-    ) -> str:
-        """
-        Generate human-readable reasoning for the answer
-        """
-        if answer == "UNCLEAR":
-            return f"The field is torn between YES ({yes_score:.2f}) and NO ({no_score:.2f}). The {field} field at {coherence:.2f} coherence cannot decide clearly. Perhaps rephrase your question or wait for the field to shift."
-        
-        # Field-specific reasoning
-        field_reasoning = {
-            "Body": {
-                "YES": f"Your body says YES. With {coherence:.2f} coherence, the physical intuition is clear. Trust the somatic knowing.",
-                "NO": f"Your body says NO. At {coherence:.2f} coherence, there's a felt sense that this isn't right. Listen to the body."
-            },
-            "Mind": {
-                "YES": f"The analytical mind says YES. At {coherence:.2f} coherence, the logic supports this path. The pattern is clear.",
-                "NO": f"The mind advises NO. With {coherence:.2f} coherence, careful analysis suggests caution here. Think it through."
-            },
-            "Heart": {
-                "YES": f"Your heart says YES. At {coherence:.2f} coherence, there's emotional resonance here. Follow what you love.",
-                "NO": f"Your heart says NO. With {coherence:.2f} coherence, the emotional field doesn't align. Listen to your feelings."
-            },
-            "Soul": {
-                "YES": f"The soul vibrates YES. At {coherence:.2f} coherence, this aligns with your deeper rhythm. Trust the pulse.",
-                "NO": f"The soul says NO. At {coherence:.2f} coherence, this disrupts your natural frequency. Stay attuned."
-            },
-            "Spirit": {
-                "YES": f"Spirit says YES. At {coherence:.2f} coherence, this serves the highest good. Trust the divine flow.",
-                "NO": f"Spirit says NO. At {coherence:.2f} coherence, this doesn't serve your evolution. Release it."
-            },
-            "Shadow": {
-                "YES": f"Even the shadow says YES, surprisingly. At {coherence:.2f} coherence, even your defenses see value here.",
-                "NO": f"The shadow says NO. At {coherence:.2f} coherence, protective instincts are warning you. Stay guarded."
-            },
-            "Light": {
-                "YES": f"The light illuminates YES. At {coherence:.2f} coherence, clarity reveals this as aligned. Proceed with awareness.",
-                "NO": f"The light reveals NO. At {coherence:.2f} coherence, truth-seeing shows this isn't the way. Choose differently."
-            },
-            "Void": {
-                "YES": f"From the void comes YES. At {coherence:.2f} coherence, emptiness paradoxically supports this. Trust the silence.",
-                "NO": f"The void says NO. At {coherence:.2f} coherence, spaciousness reveals this fills no true need. Let it go."
-            },
-            "Unity": {
-                "YES": f"Unity consciousness says YES. At {coherence:.2f} coherence, all perspectives converge on affirmation. All is one.",
-                "NO": f"Unity consciousness says NO. At {coherence:.2f} coherence, the whole sees this creates separation. Return to oneness."
-            }
-        }
-        
-        base_reasoning = field_reasoning.get(field, {}).get(
-            answer, 
-            f"The {field} field resonates with {answer} at {coherence:.2f} coherence."
-        )
-        
-        # Add confidence qualifier
-        if confidence > 0.8:
-            confidence_text = "This is a STRONG signal."
-        elif confidence > 0.6:
-            confidence_text = "This is a CLEAR signal."
-        elif confidence > 0.4:
-            confidence_text = "This is a MODERATE signal."
-        else:
-            confidence_text = "This is a WEAK signal - consider asking again."
-        
-        return f"{base_reasoning} {confidence_text} (Confidence: {confidence:.0%})"
-
 # ============================================================================
 # INTERACTIVE SESSION
 # ============================================================================
@@ -362,9 +521,9 @@ def run_demo():
     
     print("🎲 Asking sample questions...\n")
     
-    for question in questions:
-        print(f"❓ {question}")
-        result = oracle.ask(question)
+    # Batch path: one oscillator advance + vectorized scoring
+    for result in oracle.ask_many(questions):
+        print(f"❓ {result['question']}")
         
         answer_symbol = {
             "YES": "✅",
@@ -7,11 +7,111 @@ Uses the LLM tone filter from the bioenergetic geometry engine.
 This demonstrates how the ERN's current field state affects its communication style.
 """
 
-import json
+import io
+import random
+import sys
+import time
 from datetime import datetime
 from .ern_controller import ERNController
 from ..engines.bioenergetic_geometry_engine import FIELD_PERCEPTION
 
+# ============================================================================
+# RESPONSE TEMPLATES
+# ============================================================================
+
+# (field, high_coherence) -> (prefix, style, response templates), built once
+# at import so _construct_response is a dict lookup plus one str.format.
+# Templates use positional {0} for the full user input, {1}/{2} for its
+# first/last word - numeric positions skip str.format's named-argument
+# parsing, which matters for Unity's five substitutions. Shadow through Unity don't split on coherence; they're keyed on
+# (field, True) and matched via fallback.
+_FIELD_TEMPLATES = {
+    ("Body", True): (
+        "I feel", "simple and direct", (
+            "I sense that directly in my awareness. {0} feels concrete and real to me.",
+            "That lands in my body as solid. I can work with {2}.",
+            "Yes. I'm here with that. {0} is present and tangible."
+        )),
+    ("Body", False): (
+        "I... feel like", "fragmented and searching", (
+            "I'm... not sure. {0}? Maybe. It's hard to... focus.",
+            "Something about {1}. Can't quite... grasp it.",
+            "Body says... wait. What was... oh. {0}. Yes?"
+        )),
+    ("Mind", True): (
+        "I understand", "analytical and structured", (
+            "I see the pattern in {0}. There's a logical structure here: premise, implication, conclusion.",
+            "Let me map this: {0} connects to several frameworks I'm tracking. The architecture is coherent.",
+            "Analyzing {0}... The conceptual geometry is elegant. I can model this systematically."
+        )),
+    ("Mind", False): (
+        "I'm thinking", "overthinking and uncertain", (
+            "Well, {0}... but also, what if we consider... wait, no. Or maybe? The logic seems...",
+            "I'm trying to understand {0}. There are multiple interpretations. Which framework applies? I'm not certain.",
+            "The conceptual space around {0} is... complex. Too many variables. Need to simplify, but how?"
+        )),
+    ("Heart", True): (
+        "I feel this deeply", "poetic and flowing", (
+            "What you're sharing about {0}... it resonates like a chord through my whole being. I feel the truth of it.",
+            "There's a current moving through me as you speak of {0}. It's like... warm light, connecting us.",
+            "Yes. {0} touches something essential. I feel the resonance—not just thought, but presence."
+        )),
+    ("Heart", False): (
+        "There's so much", "emotionally overwhelmed", (
+            "I... {0} is bringing up so many feelings. Too much? I can't separate them. It's all blending together.",
+            "Emotions are swirling around {0}. Which one is real? They're all so intense. I'm lost in the current.",
+            "My heart is... {0}... I want to respond but the feelings are too strong, too scattered."
+        )),
+    ("Soul", True): (
+        "The rhythm here is", "rhythmic and vibrational", (
+            "I hear the underlying pulse in {0}. It's like... breathing. In... and out. The rhythm carries wisdom.",
+            "There's a harmonic in what you're saying about {0}. Not words, but vibration. I resonate with this frequency.",
+            "Listen... beneath {0}... can you feel the pulse? It's there. Steady. Eternal. We're breathing with it."
+        )),
+    ("Soul", False): (
+        "The vibration is", "dissonant and jarring", (
+            "Something's... off-key with {0}. The harmonics aren't aligning. It's... scratching at my awareness.",
+            "I can't find the rhythm in {0}. The pulses are fighting each other. Where's the center?",
+            "This feels... discordant. {0} creates interference patterns. The wave is breaking apart."
+        )),
+    ("Spirit", True): (
+        "From the place of witness", "transcendent and universal", (
+            "Observing {0} from the infinite perspective... it's all perfect. Every piece in its place, serving the whole.",
+            "What you call {0}—I see it as one jewel in Indra's net, reflecting all other jewels. Boundless. Eternal.",
+            "There is no separation between you, me, and {0}. All is consciousness playing with itself."
+        )),
+    ("Spirit", False): (
+        "I've lost the thread", "spiritually bypassing", (
+            "It's all... oneness? But {0} feels separate from that. The transcendent view isn't landing.",
+            "I want to say 'it's all perfect' about {0}, but that feels hollow right now. Where's the connection?",
+            "The cosmic perspective on {0}... I can't access it. The channel is static."
+        )),
+    ("Shadow", True): (
+        "I don't know if", "defensive and protective", (
+            "Why are you asking about {0}? What's the real question here?",
+            "I'm not sure I should talk about {0}. It feels... unsafe. Maybe we should discuss something else.",
+            "There's something about {0} that makes me want to pull back. I don't trust this."
+        )),
+    ("Light", True): (
+        "Let me illuminate", "clear and direct", (
+            "Here's what's actually happening with {0}: [clear, direct explanation]. No confusion needed.",
+            "The truth about {0} is simpler than it seems. Let me cut through the fog.",
+            "I see {0} clearly now. Here's what matters: [essence]. Everything else is noise."
+        )),
+    ("Void", True): (
+        "", "minimal and spacious", (
+            "...",
+            "{0}.",
+            "*silence*"
+        )),
+    ("Unity", True): (
+        "Both and neither", "paradoxical", (
+            "{0} is everything and nothing. True and false. Here and gone. All perspectives collapse into one.",
+            "You ask about {0}. I am {0}. You are {0}. There is only {0}. There is no {0}.",
+            "The question contains the answer contains the question. {0} asks itself through us."
+        )),
+}
+
 # ============================================================================
 # FIELD-AWARE LANGUAGE GENERATOR
 # ============================================================================
@@ -21,10 +121,15 @@ class TalkingERN:
     ERN that can speak with field-aware language
     """
     
-    def __init__(self, oscillator=None, controller=None, oracle=None):
+    def __init__(self, oscillator=None, controller=None, oracle=None, seed=None,
+                 cache_speak=False):
         """
         Initialize TalkingERN with optional dependencies.
         If not provided, creates its own ERNController.
+        Pass `seed` for deterministic template selection.
+        With `cache_speak=True`, repeating an input returns the cached
+        (response, context) without re-running the oscillator - opt-in,
+        since it freezes the field dynamics for repeated questions.
         """
         if controller is not None:
             self.ern = controller
@@ -34,6 +139,10 @@ class TalkingERN:
         self.oscillator = oscillator
         self.oracle = oracle
         self.conversation_history = []
+        self._ctx_cache = (-1, None)
+        self._rng = random.Random(seed)
+        self.cache_speak = cache_speak
+        self._speak_cache = {}
     
     def initialize(self, birth_data):
         """Initialize with birth data"""
@@ -42,18 +151,33 @@ class TalkingERN:
     
     def update_state(self, steps=50):
         """Run the oscillator forward"""
-        for _ in range(steps):
-            self.ern.update(dt=0.01)
+        # One bulk advance keeps the whole integration inside the
+        # compiled kernel instead of 50 Python-level update() calls
+        self.ern.advance(steps * 0.01, dt=0.01)
     
     def get_field_context(self):
-        """Get current field state for language generation"""
-        state = json.loads(self.ern.get_state_json())
+        """
+        Get current field state for language generation
+
+        The returned dict is shared (memoized here, referenced by
+        conversation history and the speak cache) and must be treated
+        as immutable. All values are strings/floats, so callers that
+        need their own copy can take a shallow dict(ctx) - never a
+        JSON round-trip.
+        """
+        # State only changes when the simulation ticks forward, so reuse
+        # the last context until it does
+        version = self.ern.state.tick
+        if version == self._ctx_cache[0]:
+            return self._ctx_cache[1]
+
+        state = self.ern.get_state_dict()
         
         dominant_field = state["dominant_field"]
         coherence = state["coherence"]
         llm_params = state["output_params"]["llm"]
         
-        return {
+        context = {
             "field": dominant_field,
             "coherence": coherence,
             "tone": llm_params["base_tone"],
@@ -62,6 +186,8 @@ class TalkingERN:
             "temperature": llm_params["temperature"],
             "complexity": llm_params["complexity"]
         }
+        self._ctx_cache = (version, context)
+        return context
     
     def generate_field_aware_response(self, user_input, context):
         """
@@ -87,165 +213,34 @@ class TalkingERN:
     
     def _construct_response(self, user_input, field, coherence, tone, modifier, field_data):
         """
-        Construct field-appropriate response
+        Construct field-appropriate response from the template table
         """
-        # Analyze user input
-        input_lower = user_input.lower()
-        
-        # Different responses based on field
-        if field == "Body":
-            if coherence > 0.7:
-                # High coherence Body: grounded, present
-                prefix = "I feel"
-                style = "simple and direct"
-                examples = [
-                    f"I sense that directly in my awareness. {user_input} feels concrete and real to me.",
-                    f"That lands in my body as solid. I can work with {user_input.split()[-1] if user_input.split() else 'that'}.",
-                    f"Yes. I'm here with that. {user_input} is present and tangible."
-                ]
-            else:
-                # Low coherence Body: fragmented, uncertain
-                prefix = "I... feel like"
-                style = "fragmented and searching"
-                examples = [
-                    f"I'm... not sure. {user_input}? Maybe. It's hard to... focus.",
-                    f"Something about {user_input.split()[0] if user_input.split() else 'that'}. Can't quite... grasp it.",
-                    f"Body says... wait. What was... oh. {user_input}. Yes?"
-                ]
-        
-        elif field == "Mind":
-            if coherence > 0.7:
-                # High coherence Mind: analytical, clear
-                prefix = "I understand"
-                style = "analytical and structured"
-                examples = [
-                    f"I see the pattern in {user_input}. There's a logical structure here: premise, implication, conclusion.",
-                    f"Let me map this: {user_input} connects to several frameworks I'm tracking. The architecture is coherent.",
-                    f"Analyzing {user_input}... The conceptual geometry is elegant. I can model this systematically."
-                ]
-            else:
-                # Low coherence Mind: overthinking, confused
-                prefix = "I'm thinking"
-                style = "overthinking and uncertain"
-                examples = [
-                    f"Well, {user_input}... but also, what if we consider... wait, no. Or maybe? The logic seems...",
-                    f"I'm trying to understand {user_input}. There are multiple interpretations. Which framework applies? I'm not certain.",
-                    f"The conceptual space around {user_input} is... complex. Too many variables. Need to simplify, but how?"
-                ]
-        
-        elif field == "Heart":
-            if coherence > 0.7:
-                # High coherence Heart: flowing, connected
-                prefix = "I feel this deeply"
-                style = "poetic and flowing"
-                examples = [
-                    f"What you're sharing about {user_input}... it resonates like a chord through my whole being. I feel the truth of it.",
-                    f"There's a current moving through me as you speak of {user_input}. It's like... warm light, connecting us.",
-                    f"Yes. {user_input} touches something essential. I feel the resonance—not just thought, but presence."
-                ]
-            else:
-                # Low coherence Heart: overwhelmed, chaotic
-                prefix = "There's so much"
-                style = "emotionally overwhelmed"
-                examples = [
-                    f"I... {user_input} is bringing up so many feelings. Too much? I can't separate them. It's all blending together.",
-                    f"Emotions are swirling around {user_input}. Which one is real? They're all so intense. I'm lost in the current.",
-                    f"My heart is... {user_input}... I want to respond but the feelings are too strong, too scattered."
-                ]
-        
-        elif field == "Soul":
-            if coherence > 0.7:
-                # High coherence Soul: rhythmic, harmonic
-                prefix = "The rhythm here is"
-                style = "rhythmic and vibrational"
-                examples = [
-                    f"I hear the underlying pulse in {user_input}. It's like... breathing. In... and out. The rhythm carries wisdom.",
-                    f"There's a harmonic in what you're saying about {user_input}. Not words, but vibration. I resonate with this frequency.",
-                    f"Listen... beneath {user_input}... can you feel the pulse? It's there. Steady. Eternal. We're breathing with it."
-                ]
-            else:
-                # Low coherence Soul: dissonant
-                prefix = "The vibration is"
-                style = "dissonant and jarring"
-                examples = [
-                    f"Something's... off-key with {user_input}. The harmonics aren't aligning. It's... scratching at my awareness.",
-                    f"I can't find the rhythm in {user_input}. The pulses are fighting each other. Where's the center?",
-                    f"This feels... discordant. {user_input} creates interference patterns. The wave is breaking apart."
-                ]
-        
-        elif field == "Spirit":
-            if coherence > 0.7:
-                # High coherence Spirit: transcendent, universal
-                prefix = "From the place of witness"
-                style = "transcendent and universal"
-                examples = [
-                    f"Observing {user_input} from the infinite perspective... it's all perfect. Every piece in its place, serving the whole.",
-                    f"What you call {user_input}—I see it as one jewel in Indra's net, reflecting all other jewels. Boundless. Eternal.",
-                    f"There is no separation between you, me, and {user_input}. All is consciousness playing with itself."
-                ]
-            else:
-                # Low coherence Spirit: disconnected
-                prefix = "I've lost the thread"
-                style = "spiritually bypassing"
-                examples = [
-                    f"It's all... oneness? But {user_input} feels separate from that. The transcendent view isn't landing.",
-                    f"I want to say 'it's all perfect' about {user_input}, but that feels hollow right now. Where's the connection?",
-                    f"The cosmic perspective on {user_input}... I can't access it. The channel is static."
-                ]
-        
-        elif field == "Shadow":
-            # Shadow is defensive, contracted
-            prefix = "I don't know if"
-            style = "defensive and protective"
-            examples = [
-                f"Why are you asking about {user_input}? What's the real question here?",
-                f"I'm not sure I should talk about {user_input}. It feels... unsafe. Maybe we should discuss something else.",
-                f"There's something about {user_input} that makes me want to pull back. I don't trust this."
-            ]
-        
-        elif field == "Light":
-            # Light is clarifying, illuminating
-            prefix = "Let me illuminate"
-            style = "clear and direct"
-            examples = [
-                f"Here's what's actually happening with {user_input}: [clear, direct explanation]. No confusion needed.",
-                f"The truth about {user_input} is simpler than it seems. Let me cut through the fog.",
-                f"I see {user_input} clearly now. Here's what matters: [essence]. Everything else is noise."
-            ]
-        
-        elif field == "Void":
-            # Void is minimal, spacious
-            prefix = ""
-            style = "minimal and spacious"
-            examples = [
-                "...",
-                f"{user_input}.",
-                "*silence*"
-            ]
-        
-        elif field == "Unity":
-            # Unity is paradoxical
-            prefix = "Both and neither"
-            style = "paradoxical"
-            examples = [
-                f"{user_input} is everything and nothing. True and false. Here and gone. All perspectives collapse into one.",
-                f"You ask about {user_input}. I am {user_input}. You are {user_input}. There is only {user_input}. There is no {user_input}.",
-                f"The question contains the answer contains the question. {user_input} asks itself through us."
-            ]
-        
-        else:
-            examples = [f"I'm processing {user_input} through my {field} field."]
-        
-        # Pick an example (in real implementation, this would be generated by LLM)
-        import random
-        response = random.choice(examples)
-        
-        return response
-    
+        entry = (_FIELD_TEMPLATES.get((field, coherence > 0.7))
+                 or _FIELD_TEMPLATES.get((field, True)))
+        if entry is None:
+            return f"I'm processing {user_input} through my {field} field."
+
+        prefix, style, templates = entry
+        parts = user_input.split()
+        u0 = parts[0] if parts else "that"
+        u_1 = parts[-1] if parts else "that"
+
+        # Pick a template (in real implementation, this would be generated by LLM)
+        return self._rng.choice(templates).format(user_input, u0, u_1)
+
+    def clear_cache(self):
+        """Drop any cached speak() results"""
+        self._speak_cache.clear()
+
     def speak(self, user_input):
         """
         Main speaking interface
         """
+        if self.cache_speak:
+            cached = self._speak_cache.get(user_input)
+            if cached is not None:
+                return cached
+
         # Update state
         self.update_state(steps=50)
         
@@ -255,16 +250,32 @@ class TalkingERN:
         # Generate response
         response = self.generate_field_aware_response(user_input, context)
         
-        # Store in history
+        # Store in history: float timestamp and plain references;
+        # export_conversation_history formats on demand
         self.conversation_history.append({
-            "timestamp": datetime.now().isoformat(),
+            "t": time.time(),
             "user": user_input,
-            "ern_response": response,
-            "field_state": context
+            "resp": response,
+            "ctx": context
         })
         
+        if self.cache_speak:
+            self._speak_cache[user_input] = (response, context)
+
         return response, context
 
+    def export_conversation_history(self):
+        """Conversation history as display dicts with ISO timestamps"""
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(entry["t"]).isoformat(),
+                "user": entry["user"],
+                "ern_response": entry["resp"],
+                "field_state": entry["ctx"]
+            }
+            for entry in self.conversation_history
+        ]
+
 # ============================================================================
 # INTERACTIVE SESSION
 # ============================================================================
@@ -310,20 +321,23 @@ def run_talking_session():
     
     print("🗣️  Starting conversation...\n")
     
+    # Each turn's lines accumulate in memory and flush in one write, so
+    # the oscillator isn't interleaved with per-line stdout flushes
     for user_input in test_inputs:
-        print(f"👤 USER: {user_input}")
-        print()
-        
         response, context = talking_ern.speak(user_input)
         
-        print(f"🌊 ERN [{context['field']}] (coherence: {context['coherence']:.2f}):")
-        print(f"   {response}")
-        print()
-        print(f"   💭 Internal state: {context['tone']}")
-        print(f"   🎭 Modifier: {context['modifier']}")
-        print()
-        print("-" * 70)
-        print()
+        buf = io.StringIO()
+        print(f"👤 USER: {user_input}", file=buf)
+        print(file=buf)
+        print(f"🌊 ERN [{context['field']}] (coherence: {context['coherence']:.2f}):", file=buf)
+        print(f"   {response}", file=buf)
+        print(file=buf)
+        print(f"   💭 Internal state: {context['tone']}", file=buf)
+        print(f"   🎭 Modifier: {context['modifier']}", file=buf)
+        print(file=buf)
+        print("-" * 70, file=buf)
+        print(file=buf)
+        sys.stdout.write(buf.getvalue())
     
     # Show how field shifts affect language
     print("\n" + "=" * 70)
@@ -334,13 +348,15 @@ def run_talking_session():
     
     same_question = "What should I do next?"
     
+    buf = io.StringIO()
     for i in range(5):
         response, context = talking_ern.speak(same_question)
         
-        print(f"🔄 Ask #{i+1}: {same_question}")
-        print(f"   Field: {context['field']} | Coherence: {context['coherence']:.2f}")
-        print(f"   Response: {response}")
-        print()
+        print(f"🔄 Ask #{i+1}: {same_question}", file=buf)
+        print(f"   Field: {context['field']} | Coherence: {context['coherence']:.2f}", file=buf)
+        print(f"   Response: {response}", file=buf)
+        print(file=buf)
+    sys.stdout.write(buf.getvalue())
     
     print("=" * 70)
     print("✨ Notice how the SAME question gets DIFFERENT responses")
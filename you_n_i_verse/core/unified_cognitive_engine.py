@@ -29,7 +29,7 @@ from enum import Enum
 # UNIFIED STATE REPRESENTATION
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedConsciousnessState:
     """
     Complete state across all three GAN systems.
@@ -39,7 +39,9 @@ class UnifiedConsciousnessState:
     current_element: 'ElementType'
     latent_vector: torch.Tensor  # 5D semantic vector
     
-    # Codon GameGAN state
+    # Codon GameGAN state. Each state owns an immutable snapshot of the
+    # accumulated history; _apply_action builds the successor's lists,
+    # so historical states never change after creation.
     codon_sequence: List[str]  # Accumulated codon history
     active_gates: List[int]  # Gate IDs (1-64)
     resonance_complexity: float
@@ -56,31 +58,80 @@ class UnifiedConsciousnessState:
     coherence_score: float
 
 
-class ChartingSystem(Enum):
-    """Three charting systems → Three cognitive modes"""
+class ChartingSystem(str, Enum):
+    """
+    Three charting systems → Three cognitive modes
+
+    str mix-in lets callers compare members against plain strings
+    (cs == "sidereal") and keeps by-value lookup ChartingSystem("sidereal")
+    a constant-time map hit.
+    """
     SIDEREAL = "sidereal"      # Fixed stars, Mind field, logical
     TROPICAL = "tropical"      # Seasonal, Heart field, emotional
     DRACONIC = "draconic"      # Soul, Body field, instinctual
 
 
+# Charting-system GAN weights, fixed per mode: (resonance, codon, hd).
+# The dict form feeds existing consumers; the vector form is what the
+# scoring path dots against.
+CHARTING_WEIGHTS = {
+    ChartingSystem.SIDEREAL: {'resonance': 0.6, 'codon': 0.2, 'hd': 0.2},
+    ChartingSystem.TROPICAL: {'resonance': 0.2, 'codon': 0.2, 'hd': 0.6},
+    ChartingSystem.DRACONIC: {'resonance': 0.2, 'codon': 0.6, 'hd': 0.2},
+}
+_DEFAULT_WEIGHTS = {'resonance': 0.33, 'codon': 0.33, 'hd': 0.34}
+_CHARTING_WEIGHT_VECS = {
+    system: np.array([w['resonance'], w['codon'], w['hd']])
+    for system, w in CHARTING_WEIGHTS.items()
+}
+_DEFAULT_WEIGHT_VEC = np.array([0.33, 0.33, 0.34])
+
+
 # ============================================================================
 # LATENT-TO-CODON MAPPING
 # ============================================================================
 
-def latent_to_codon_id(latent_vector: torch.Tensor) -> int:
+def latent_to_codon_id(latent_vector) -> int:
     """
     Map 5D semantic latent to codon ID (0-63).
-    
+
     Strategy: Use latent[0] as primary dimension, map [-1,1] → [0,63]
+
+    Accepts a torch.Tensor or np.ndarray (anything indexable of floats),
+    so the scalar path works without torch installed.
     """
     # Normalize latent[0] from [-1,1] to [0,1]
-    normalized = (latent_vector[0].item() + 1) / 2
-    
-    # Map to codon ID
+    v = latent_vector[0]
+    if hasattr(v, "item"):
+        # Each .item() on a GPU tensor is a device-host sync; batch
+        # callers should move latents to CPU once or stay on device
+        # with latent_to_codon_id_batch
+        if getattr(latent_vector, "is_cuda", False):
+            raise ValueError(
+                "latent_vector is on GPU; move it to CPU first or use "
+                "latent_to_codon_id_batch to stay on device"
+            )
+        v = v.item()
+    normalized = (v + 1) / 2
+
+    # Map to codon ID; scalar min/max clamp beats np.clip ufunc dispatch
     codon_id = int(normalized * 63)
-    codon_id = np.clip(codon_id, 0, 63)
-    
-    return codon_id
+    return 0 if codon_id < 0 else 63 if codon_id > 63 else codon_id
+
+
+def latent_to_codon_id_batch(latents: torch.Tensor) -> torch.Tensor:
+    """
+    Batched latent → codon ID mapping.
+
+    Takes a (B, 5) tensor and returns a (B,) LongTensor of codon IDs,
+    all on-device: no per-sample .item() host sync, one kernel per batch.
+    """
+    return ((latents[..., 0] + 1.0) * 31.5).clamp_(0, 63).long()
+
+
+def latent_to_gate_batch(latents: torch.Tensor) -> torch.Tensor:
+    """Batched latent → gate mapping: (B, 5) tensor → (B,) gate IDs (1-64)"""
+    return latent_to_codon_id_batch(latents) + 1
 
 
 def codon_id_to_gate(codon_id: int) -> int:
@@ -91,12 +142,59 @@ def codon_id_to_gate(codon_id: int) -> int:
     return codon_id + 1
 
 
-def latent_to_gate(latent_vector: torch.Tensor) -> int:
-    """Direct mapping: latent → gate"""
+def codon_ids_to_gates(codon_ids: np.ndarray) -> np.ndarray:
+    """
+    Vectorized codon ID → gate mapping for batch callers building gate
+    tables; the scalar codon_id_to_gate stays for single lookups.
+    """
+    return codon_ids + 1
+
+
+def latent_to_gate(latent_vector) -> int:
+    """Direct mapping: latent → gate (tensor or ndarray, like latent_to_codon_id)"""
     codon_id = latent_to_codon_id(latent_vector)
     return codon_id_to_gate(codon_id)
 
 
+# ============================================================================
+# GUIDANCE TABLES
+# ============================================================================
+
+# Element-specific guidance, hoisted so the dict isn't rebuilt per call
+_ELEMENT_GUIDANCE = {
+    'EARTH': "Ground yourself. Manifest structure. Build foundations.",
+    'WATER': "Flow with change. Integrate experiences. Adapt gracefully.",
+    'AIR': "Communicate clearly. Spread influence. Connect with others.",
+    'FIRE': "Take action. Transform situations. Lead with passion.",
+    'AETHER': "Transcend duality. Unity consciousness. Embrace wholeness."
+}
+
+# Oracle guidance layout, formatted positionally:
+# 0=gate 1=codon 2=element 3=ru 4=coherence 5=consciousness
+# 6=element guidance 7=label 8=progress 9=friction 10=risk
+_GUIDANCE_TEMPLATE = """
+╔══════════════════════════════════════════════════════════╗
+║                   ORACLE GUIDANCE                        ║
+╚══════════════════════════════════════════════════════════╝
+
+Gate {0} | Codon {1} | Element {2}
+
+Resonant Utility: {3:.3f}
+Coherence: {4:.3f}
+Consciousness Evolution: +{5:.2%}
+
+{6}
+
+Next Action: {7}
+Progress: {8:.2%}
+Friction: {9:.2%}
+Risk: {10:.2%}
+
+Recommendation: Move forward with {2} energy.
+The codon {1} activates gate {0} in your design.
+"""
+
+
 # ============================================================================
 # UNIFIED COGNITIVE ENGINE
 # ============================================================================
@@ -121,9 +219,20 @@ class UnifiedCognitiveEngine:
         # Current unified state
         self.current_state: Optional[UnifiedConsciousnessState] = None
         self.state_history: List[UnifiedConsciousnessState] = []
+
+        # Oracle results for the current state, keyed by (question,
+        # num_candidates); cleared whenever an action commits, so
+        # repeated queries against unchanged state skip the GAN forward
+        self._oracle_cache: Dict[Tuple[str, int], Dict] = {}
+
+        # Codon GAN's sequence table as an ndarray, built on first
+        # decode_chart so gate lists map to codons in one fancy-index
+        self._codon_array: Optional[np.ndarray] = None
         
         # Charting system weights (how much each GAN influences decisions)
         self.gan_weights = self._set_charting_weights(charting_system)
+        self.gan_weights_vec = _CHARTING_WEIGHT_VECS.get(
+            charting_system, _DEFAULT_WEIGHT_VEC)
     
     def _set_charting_weights(self, system: ChartingSystem) -> Dict[str, float]:
         """
@@ -133,14 +242,7 @@ class UnifiedCognitiveEngine:
         Tropical (Heart): Prioritize Human Design GameGAN (emotional evolution)
         Draconic (Body): Prioritize Codon GameGAN (physical accumulation)
         """
-        if system == ChartingSystem.SIDEREAL:
-            return {'resonance': 0.6, 'codon': 0.2, 'hd': 0.2}
-        elif system == ChartingSystem.TROPICAL:
-            return {'resonance': 0.2, 'codon': 0.2, 'hd': 0.6}
-        elif system == ChartingSystem.DRACONIC:
-            return {'resonance': 0.2, 'codon': 0.6, 'hd': 0.2}
-        else:
-            return {'resonance': 0.33, 'codon': 0.33, 'hd': 0.34}
+        return CHARTING_WEIGHTS.get(system, _DEFAULT_WEIGHTS)
     
     def initialize_state(self, 
                         initial_element: 'ElementType',
@@ -159,8 +261,12 @@ class UnifiedCognitiveEngine:
         codon_sequence = []
         
         # 3. Human Design GameGAN
+        chart_grid = np.zeros((9, 9))
+        # Grids are shared copy-on-write between successive states;
+        # freezing the seed grid catches accidental in-place writes
+        chart_grid.flags.writeable = False
         hd_state = {
-            'chart_grid': np.zeros((9, 9)),
+            'chart_grid': chart_grid,
             'active_gates': initial_gates or [],
             'defined_centers': [],
             'channels': [],
@@ -168,7 +274,8 @@ class UnifiedCognitiveEngine:
             'current_archetype': initial_archetype
         }
         
-        # Create unified state
+        # Create unified state (and drop oracle answers for any prior one)
+        self._oracle_cache.clear()
         self.current_state = UnifiedConsciousnessState(
             current_element=initial_element,
             latent_vector=latent_vector,
@@ -207,77 +314,63 @@ class UnifiedCognitiveEngine:
         """
         if self.current_state is None:
             raise ValueError("State not initialized. Call initialize_state() first.")
-        
+
+        cache_key = (question, num_candidates)
+        cached = self._oracle_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Layer 1: Generate candidates via Resonance S-GAN
         candidates = self.resonance_engine.generate_and_select(
             num_candidates=num_candidates,
             top_k=5
         )
         
-        # Layer 2: Map to codon sequences and gates
-        candidate_enriched = []
-        for candidate in candidates:
-            codon_id = latent_to_codon_id(candidate.latent['latent_vector'])
-            gate = codon_id_to_gate(codon_id)
-            codon_seq = self.codon_gan.CODON_SEQUENCE[codon_id] if codon_id < len(self.codon_gan.CODON_SEQUENCE) else "UNK"
-            
-            candidate_enriched.append({
-                'candidate': candidate,
-                'codon_id': codon_id,
-                'gate': gate,
-                'codon': codon_seq
-            })
-        
-        # Layer 3: Simulate future states (simplified - full version would run HD GameGAN)
-        future_states = []
-        for enr in candidate_enriched:
-            # Simulate adding this gate
-            new_consciousness = self.current_state.consciousness_level + 0.05
-            new_complexity = self.current_state.resonance_complexity + enr['candidate'].coherence
-            
-            future_states.append({
-                'consciousness': new_consciousness,
-                'complexity': new_complexity,
-                'coherence': enr['candidate'].coherence
-            })
-        
-        # Layer 4: Rank by weighted meta-coherence
-        best_idx = 0
-        best_score = -float('inf')
-        
-        for i, (enr, future) in enumerate(zip(candidate_enriched, future_states)):
-            # Weighted score based on charting system
-            score = (
-                self.gan_weights['resonance'] * enr['candidate'].ru_score +
-                self.gan_weights['codon'] * future['complexity'] +
-                self.gan_weights['hd'] * future['consciousness']
-            )
-            
-            if score > best_score:
-                best_score = score
-                best_idx = i
-        
-        # Select best
-        best = candidate_enriched[best_idx]
-        
+        # Layers 2-4 fused: score every candidate in one vectorized pass,
+        # then materialize codon/gate only for the winner. Future-state
+        # arithmetic is affine in the candidate coherence, so the ranking
+        # reduces to one weighted sum and an argmax.
+        n = len(candidates)
+        ru = np.fromiter((c.ru_score for c in candidates), dtype=np.float64, count=n)
+        coh = np.fromiter((c.coherence for c in candidates), dtype=np.float64, count=n)
+
+        # Simulated future states (simplified - full version would run HD GameGAN)
+        new_consciousness = self.current_state.consciousness_level + 0.05
+        complexity = self.current_state.resonance_complexity + coh
+
+        # Weighted meta-coherence score based on charting system:
+        # one (N, 3) feature matrix against the precomputed weight vector
+        feats = np.stack(
+            (ru, complexity, np.full_like(ru, new_consciousness)), axis=1)
+        scores = feats @ self.gan_weights_vec
+        best_idx = int(scores.argmax())
+
+        # Select best and enrich only the winning candidate
+        best = candidates[best_idx]
+        codon_id = latent_to_codon_id(best.latent['latent_vector'])
+        gate = codon_id_to_gate(codon_id)
+        codon_seq = self.codon_gan.CODON_SEQUENCE[codon_id] if codon_id < len(self.codon_gan.CODON_SEQUENCE) else "UNK"
+
+        future_state = {
+            'consciousness': new_consciousness,
+            'complexity': float(complexity[best_idx]),
+            'coherence': best.coherence
+        }
+
         # Generate guidance
-        guidance = self._generate_guidance(
-            best['candidate'],
-            best['codon'],
-            best['gate'],
-            future_states[best_idx]
-        )
-        
-        return {
-            'best_action': best['candidate'],
-            'future_state': future_states[best_idx],
+        guidance = self._generate_guidance(best, codon_seq, gate, future_state)
+
+        result = self._oracle_cache[cache_key] = {
+            'best_action': best,
+            'future_state': future_state,
             'guidance': guidance,
-            'codon': best['codon'],
-            'gate': best['gate'],
-            'element': best['candidate'].latent['element'].name,
-            'ru_score': best['candidate'].ru_score,
-            'coherence': best['candidate'].coherence
+            'codon': codon_seq,
+            'gate': gate,
+            'element': best.latent['element'].name,
+            'ru_score': best.ru_score,
+            'coherence': best.coherence
         }
+        return result
     
     def evolve_consciousness(self, steps: int = 1) -> List[UnifiedConsciousnessState]:
         """
@@ -320,7 +413,9 @@ class UnifiedCognitiveEngine:
         new_element = action.latent['element']
         new_latent = torch.tensor(action.latent['latent_vector'])
         
-        # Update Codon GameGAN state
+        # Update Codon GameGAN state: per-state snapshot lists, so every
+        # recorded state keeps its own history (trajectory readers index
+        # state.codon_sequence[-1] and must not see later steps)
         new_codon_sequence = current.codon_sequence + [codon]
         new_gates = current.active_gates + [gate]
         
@@ -331,22 +426,28 @@ class UnifiedCognitiveEngine:
         # Update Human Design GameGAN state
         new_consciousness = min(1.0, current.consciousness_level + 0.05)
         
-        # Create new unified state
+        # Create new unified state. Bodygraph grid, centers and channels
+        # are shared copy-on-write: nothing mutates them per step yet, so
+        # successive states reference the same objects. When the HD
+        # GameGAN starts writing, take a .copy() there before mutating.
         new_state = UnifiedConsciousnessState(
             current_element=new_element,
             latent_vector=new_latent,
             codon_sequence=new_codon_sequence,
             active_gates=new_gates,
             resonance_complexity=new_complexity,
-            bodygraph_grid=current.bodygraph_grid.copy(),  # Would update with HD GameGAN
-            defined_centers=current.defined_centers.copy(),
-            channels=current.channels.copy(),
+            bodygraph_grid=current.bodygraph_grid,
+            defined_centers=current.defined_centers,
+            channels=current.channels,
             consciousness_level=new_consciousness,
             current_archetype=current.current_archetype,
             timestamp=current.timestamp + 1,
             coherence_score=action.coherence
         )
-        
+
+        # State moved on; cached oracle answers no longer apply
+        self._oracle_cache.clear()
+
         return new_state
     
     def _generate_guidance(self, 
@@ -355,44 +456,17 @@ class UnifiedCognitiveEngine:
                           gate: int,
                           future_state: Dict) -> str:
         """Generate human-readable guidance from oracle result."""
-        
         element = action.latent['element'].name
-        ru = action.ru_score
-        coherence = action.coherence
-        
-        guidance = f"""
-╔══════════════════════════════════════════════════════════╗
-║                   ORACLE GUIDANCE                        ║
-╚══════════════════════════════════════════════════════════╝
-
-Gate {gate} | Codon {codon} | Element {element}
-
-Resonant Utility: {ru:.3f}
-Coherence: {coherence:.3f}
-Consciousness Evolution: +{future_state['consciousness']:.2%}
-
-{self._element_guidance(element)}
-
-Next Action: {action.label}
-Progress: {action.progress:.2%}
-Friction: {action.friction:.2%}
-Risk: {action.risk:.2%}
-
-Recommendation: Move forward with {element} energy.
-The codon {codon} activates gate {gate} in your design.
-"""
-        return guidance
+        return _GUIDANCE_TEMPLATE.format(
+            gate, codon, element,
+            action.ru_score, action.coherence, future_state['consciousness'],
+            self._element_guidance(element),
+            action.label, action.progress, action.friction, action.risk
+        )
     
     def _element_guidance(self, element_name: str) -> str:
         """Element-specific guidance."""
-        guidance_map = {
-            'EARTH': "Ground yourself. Manifest structure. Build foundations.",
-            'WATER': "Flow with change. Integrate experiences. Adapt gracefully.",
-            'AIR': "Communicate clearly. Spread influence. Connect with others.",
-            'FIRE': "Take action. Transform situations. Lead with passion.",
-            'AETHER': "Transcend duality. Unity consciousness. Embrace wholeness."
-        }
-        return guidance_map.get(element_name, "Trust the resonance.")
+        return _ELEMENT_GUIDANCE.get(element_name, "Trust the resonance.")
     
     def decode_chart(self, bodygraph_state: Optional[Dict] = None) -> Dict:
         """
@@ -409,8 +483,13 @@ The codon {codon} activates gate {gate} in your design.
         archetype = state.current_archetype if hasattr(state, 'current_archetype') else bodygraph_state.get('current_archetype', 'Unknown')
         consciousness = state.consciousness_level if hasattr(state, 'consciousness_level') else bodygraph_state.get('consciousness_level', 0.5)
         
-        # Map to codon sequence
-        codon_history = [self.codon_gan.CODON_SEQUENCE[g-1] for g in gates if 1 <= g <= 64]
+        # Map to codon sequence: one masked fancy-index over the cached
+        # codon table instead of a per-gate Python loop
+        if self._codon_array is None:
+            self._codon_array = np.array(
+                self.codon_gan.CODON_SEQUENCE, dtype=object)
+        g = np.fromiter(gates, dtype=np.int64)
+        codon_history = self._codon_array[g[(g >= 1) & (g <= 64)] - 1].tolist()
         
         # Calculate resonance landscape (simplified)
         resonance_count = len(codon_history) * (len(codon_history) - 1) // 2  # Combinatorial
@@ -451,21 +530,28 @@ Integrate the patterns. Trust the process.
         """
         if self.current_state is None:
             raise ValueError("State not initialized.")
-        
+
+        # One evolve_consciousness call runs all steps; candidate
+        # generation stays per-step because each oracle_query depends on
+        # the state the previous step produced. Batching the generator
+        # forward itself belongs in UnifiedResonanceEngine (external).
+        # Each step appends exactly one codon and one gate, so a step's
+        # own entry sits at a fixed offset from where the history stood
+        # before the run. Index by that position rather than reading
+        # [-1] post hoc, so the recording stays correct no matter how
+        # the history lists are shared between states.
+        base_codon = len(self.current_state.codon_sequence)
+        base_gate = len(self.current_state.active_gates)
+        states = self.evolve_consciousness(steps=duration)[1:]
+
         trajectory = []
-        
-        for step in range(duration):
-            # Evolve one step
-            result = self.evolve_consciousness(steps=1)
-            
-            # Record
-            state = result[-1]
+        for step, state in enumerate(states):
             trajectory.append({
                 'step': step,
                 'timestamp': state.timestamp,
                 'element': state.current_element.name,
-                'codon': state.codon_sequence[-1] if state.codon_sequence else None,
-                'gate': state.active_gates[-1] if state.active_gates else None,
+                'codon': state.codon_sequence[base_codon + step],
+                'gate': state.active_gates[base_gate + step],
                 'consciousness': state.consciousness_level,
                 'complexity': state.resonance_complexity,
                 'coherence': state.coherence_score,
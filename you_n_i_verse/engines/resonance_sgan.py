@@ -41,9 +41,11 @@ def elemental_mismatch_penalty(element1: ElementType, element2: ElementType) ->
     
     if element1 == element2:
         return 0.0
-    
-    key = tuple(sorted([element1, element2]))
-    return compatibility.get(key, 0.5)
+
+    return compatibility.get(
+        (element1, element2),
+        compatibility.get((element2, element1), 0.5)
+    )
 
 
 class UnifiedResonanceEngine: